@@ -8,35 +8,132 @@ Usage:
     $ python old_main.py "from data.json[users.*] to output.toml where age > 25"
 """
 
+import functools
 import json
 import toml
 import yaml
 import xmltodict
 from jsonpath_ng import parse
+from datetime import datetime, date, time
+from decimal import Decimal
 import argparse
+import math
+import mmap
 import sys
 import os
-from lark import Lark, Transformer
+
+try:
+    # libyaml, much faster
+    from yaml import CSafeDumper as _YAML_DUMPER
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:
+    from yaml import SafeDumper as _YAML_DUMPER
+    from yaml import SafeLoader as _YAML_LOADER
+
+try:
+    import tomllib  # python 3.11+, much faster than the toml package
+except ImportError:
+    tomllib = None
+
+try:
+    import orjson  # optional: much faster json parsing/serialization
+except ImportError:
+    orjson = None
+
+try:
+    # only the draft query transformer below uses lark, now a dev dependency
+    from lark import Transformer
+except ImportError:
+    Transformer = object
 
 # syntax should be dataconv file.json (from) file.toml (to) where "author": "James Smith"
 
 # 1 loading file
 def smart_load_wrapper(filename) -> dict:
-    with open(filename, "r", encoding="utf-8") as file:
-        if filename.endswith(".json"):
-            return json.load(file)
-        elif filename.endswith(".toml"):
-            return toml.load(file)
-        elif filename.endswith(".yaml") or filename.endswith(".yml"):
-            return yaml.safe_load(file)
-        elif filename.endswith(".xml"):
-            return xmltodict.parse(file.read())
-        else:
-            raise ValueError(f"Unsupported file format: {filename}")
+    if orjson is not None and filename.endswith(".json"):
+        # orjson parses straight from bytes, no text decode step. map the file
+        # and hand orjson the whole buffer as one slice instead of copying it
+        # through read(); empty files and platforms without mmap fall back
+        with open(filename, "rb") as file:
+            try:
+                mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                return _loads_json(file.read())
+            with mm, memoryview(mm) as view:
+                return _loads_json(view)
+
+    # one read for the whole file, the parsers then work on the in-memory buffer
+    # instead of pulling small chunks through a text decoder
+    with open(filename, "rb") as file:
+        buf = file.read()
+
+    if filename.endswith(".json"):
+        return json.loads(buf)
+    elif filename.endswith(".toml"):
+        text = buf.decode("utf-8")
+        return tomllib.loads(text) if tomllib is not None else toml.loads(text)
+    elif filename.endswith(".yaml") or filename.endswith(".yml"):
+        return yaml.load(buf, Loader=_YAML_LOADER)
+    elif filename.endswith(".xml"):
+        return xmltodict.parse(buf)
+    else:
+        raise ValueError(f"Unsupported file format: {filename}")
+
+
+def _loads_json(buf):
+    # orjson rejects NaN/Infinity and integers over 64 bits, json accepts them
+    try:
+        return orjson.loads(buf)
+    except orjson.JSONDecodeError:
+        return json.loads(bytes(buf))
 
 # 2 saving file
+_ORJSON_SAVE_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _has_non_finite(data):
+    stack = [data]
+    while stack:
+        v = stack.pop()
+        if isinstance(v, dict):
+            stack.extend(v.values())
+        elif isinstance(v, (list, tuple)):
+            stack.extend(v)
+        elif isinstance(v, float) and not math.isfinite(v):
+            return True
+    return False
+
+
+def _orjson_dumps(data):
+    # None means json has to write it: orjson can't encode it (e.g. ints over
+    # 64 bits; datetimes are passed through so json rejects them as before) or
+    # would write NaN/Infinity as null. any NaN shows up as null, so data
+    # without nulls skips the scan
+    try:
+        payload = orjson.dumps(data, option=_ORJSON_SAVE_OPTIONS)
+    except orjson.JSONEncodeError:
+        return None
+    if b"null" in payload and _has_non_finite(data):
+        return None
+    return payload
+
+
 def smart_save(data, filepath, *args, **kwargs):
     try:
+        # orjson only covers a plain dump, custom json.dump options still use stdlib
+        if orjson is not None and filepath.endswith(".json") and not args and not kwargs:
+            payload = _orjson_dumps(data)
+            if payload is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(payload)
+                return filepath
+
         with open(filepath, 'w', encoding='utf-8') as f:
             if filepath.endswith(".json"):
                 json.dump(data, f, *args, **kwargs)
@@ -45,7 +142,7 @@ def smart_save(data, filepath, *args, **kwargs):
                 toml.dump(data, f)
 
             elif filepath.endswith(('.yaml', '.yml')):
-                yaml.safe_dump(data, f, **kwargs)
+                yaml.dump(data, f, Dumper=_YAML_DUMPER, **kwargs)
 
             elif filepath.endswith(".xml"):
                 xmltodict.unparse(data, output=f, **kwargs)
@@ -59,140 +156,152 @@ def smart_save(data, filepath, *args, **kwargs):
 
 
 # 3. verification
-def validate_json(data, path="$") -> list:
-    import math
-
-    errors = []
-    
-    def _walk(v, p):
-        nonlocal errors
-
-        if v is None or isinstance(v, (int, str, bool)):
-            return
-
-        elif isinstance(v, float):
-            if not math.isfinite(v):
-                errors.append(f"{p}: non-finite float {v}")
-            return
-
-        elif isinstance(v, dict):
-            for k, subv in v.items():
-                if not isinstance(k, str):
-                    errors.append(f"{p}: non-string key {k}")
-                _walk(subv, f"{p}.{k}")
-            return
-
-        elif isinstance(v, list):
-            for i, subv in enumerate(v):
-                _walk(subv, f"{p}[{i}]")
-            return
-        else:
-            errors.append(f"{p}: {v} is not a valid value")
-
-    _walk(data, path)
-    return errors
+# all formats share one walker driven by a {type: handler} table, so each node
+# costs a single dict lookup on its exact type instead of an isinstance chain.
+# the per-format rules (key policy, TOML array homogeneity, leaf types, what
+# counts as invalid) are just different handler tables.
+#
+# the walk uses an explicit stack instead of recursion: no call frame per node
+# and no RecursionError on deeply nested input. children are pushed in reverse
+# so issues are still reported in document order.
+#
+# paths are not formatted while walking. each stack entry carries its parent
+# node plus (separator, key), and the "$.a[0].b" string is only rebuilt by
+# _fmt_path when an issue is actually reported, so valid data allocates none.
+def _fmt_path(parent, sep, key) -> str:
+    parts = []
+    node = (parent, sep, key)
+    while node is not None:
+        parent, sep, key = node
+        parts.append(f"[{key}]" if sep == "[" else f"{sep}{key}")
+        node = parent
+    return "".join(reversed(parts))
+
+
+def _noop(v, parent, sep, key, errors, warnings, stack):
+    return
+
+
+# container handlers don't push children whose exact type is a known-valid
+# leaf (leaf_types), so most scalars never cost a stack push/pop, a tuple or
+# a handler call. the leaf types keep _noop entries in the table for the root
+# value and for the isinstance fallback.
+def _make_list_h(leaf_types, check_homogeneous=False):
+    def _list_h(v, parent, sep, key, errors, warnings, stack):
+        # set of types is built in C; isinstance only runs for mixed lists,
+        # so subclasses of the first element's type are still accepted
+        if check_homogeneous and v and len(set(map(type, v))) > 1:
+            first_type = type(v[0])
+            if not all(isinstance(elem, first_type) for elem in v):
+                warnings.append(f"{_fmt_path(parent, sep, key)}: all elements in list must be of the same type (TOML requirement)")
+        node = (parent, sep, key)
+        stack.extend(reversed([(subv, node, "[", i) for i, subv in enumerate(v) if type(subv) not in leaf_types]))
+    return _list_h
+
+
+def _make_dict_h(key_message, leaf_types, key_is_warning=False):
+    def _dict_h(v, parent, sep, key, errors, warnings, stack):
+        issues = warnings if key_is_warning else errors
+        node = (parent, sep, key)
+        children = []
+        for k, subv in v.items():
+            if type(k) is not str and not isinstance(k, str):
+                issues.append(f"{_fmt_path(parent, sep, key)}: {key_message(k)}")
+            if type(subv) not in leaf_types:
+                children.append((subv, node, ".", k))
+        stack.extend(reversed(children))
+    return _dict_h
+
+
+def _make_handlers(leaf_types, containers):
+    handlers = dict.fromkeys(leaf_types, _noop)
+    handlers.update(containers)
+    return handlers
+
+
+def _make_float_h(isfinite):
+    def _float_h(v, parent, sep, key, errors, warnings, stack):
+        if not isfinite(v):
+            errors.append(f"{_fmt_path(parent, sep, key)}: non-finite float {v}")
+    return _float_h
+
+
+def _invalid_h(v, parent, sep, key, errors, warnings, stack):
+    errors.append(f"{_fmt_path(parent, sep, key)}: {v} is not a valid value")
+
+
+def _yaml_invalid_h(v, parent, sep, key, errors, warnings, stack):
+    errors.append(f"{_fmt_path(parent, sep, key)}: {v!r} (type {type(v).__name__}) is not a valid YAML value")
+
+
+def _xml_leaf_h(v, parent, sep, key, errors, warnings, stack):
+    try:
+        _ = str(v)
+    except Exception as e:
+        errors.append(
+            f"{_fmt_path(parent, sep, key)}: value {v!r} (type {type(v).__name__}) "
+            f"is not convertible to string for XML: {e}"
+        )
 
-def validate_toml(data, path="$") -> list:
-    import math
-    from datetime import datetime, date, time
 
-    warnings = []
+def _walk(data, path, handlers, fallback):
     errors = []
+    warnings = []
+    stack = [(data, None, "", path)]
 
-    def _walk(v, p):
-        nonlocal errors, warnings
-
-        if v is None or isinstance(v, (int, str, bool, datetime, date, time)):
-            return
-
-        elif isinstance(v, float):
-            if not math.isfinite(v):
-                errors.append(f"{p}: non-finite float {v}")
-            return
-
-        elif isinstance(v, dict):
-            for k, subv in v.items():
-                if not isinstance(k, str):
-                    errors.append(f"{p}: non-string key {k}")
-                _walk(subv, f"{p}.{k}")
-            return
-
-        elif isinstance(v, list):
-            if v:
-                first_type = type(v[0])
-                if not all(isinstance(elem, first_type) for elem in v):
-                    warnings.append(f"{p}: all elements in list must be of the same type (TOML requirement)")
-            for i, subv in enumerate(v):
-                _walk(subv, f"{p}[{i}]")
-            return
-        else:
-            errors.append(f"{p}: {v} is not a valid value")
+    while stack:
+        v, parent, sep, key = stack.pop()
+        h = handlers.get(type(v))
+        if h is None:
+            # subclasses (OrderedDict, IntEnum, ...) miss the exact-type lookup
+            h = next((th for t, th in handlers.items() if isinstance(v, t)), fallback)
+        h(v, parent, sep, key, errors, warnings, stack)
 
-    _walk(data, path)
     return errors, warnings
 
-def validate_yaml(data, path="$") -> list:
-    from datetime import datetime, date
-    from decimal import Decimal
-    import math
 
-    errors = []
-    warnings = []
-
-    def _walk(v, p):
-        nonlocal errors, warnings
+# handler tables are built once at import; validate_* only start a walk
+_JSON_LEAVES = frozenset((bool, int, str, type(None)))
+_JSON_HANDLERS = _make_handlers(_JSON_LEAVES, {
+    dict: _make_dict_h(lambda k: f"non-string key {k}", _JSON_LEAVES),
+    list: _make_list_h(_JSON_LEAVES),
+    float: _make_float_h(math.isfinite),
+})
+
+_TOML_LEAVES = frozenset((bool, int, str, type(None), datetime, date, time))
+_TOML_HANDLERS = _make_handlers(_TOML_LEAVES, {
+    dict: _make_dict_h(lambda k: f"non-string key {k}", _TOML_LEAVES),
+    list: _make_list_h(_TOML_LEAVES, check_homogeneous=True),
+    float: _make_float_h(math.isfinite),
+})
+
+_YAML_LEAVES = frozenset((bool, int, str, type(None), datetime, date, Decimal))
+_YAML_HANDLERS = _make_handlers(_YAML_LEAVES, {
+    dict: _make_dict_h(lambda k: f"non-string key. Not recommended for YAML {k}", _YAML_LEAVES, key_is_warning=True),
+    list: _make_list_h(_YAML_LEAVES),
+    float: _make_float_h(math.isfinite),
+})
+
+# str() of these can't fail, so they never need the conversion probe
+_XML_LEAVES = frozenset((bool, int, float, str, type(None)))
+_XML_HANDLERS = _make_handlers(_XML_LEAVES, {
+    dict: _make_dict_h(lambda k: f"non-string key {k!r} (XML tag/attr must be str)", _XML_LEAVES),
+    list: _make_list_h(_XML_LEAVES),
+})
 
-        if v is None or isinstance(v, (int, str, bool, datetime, date, Decimal)):
-            return
 
-        elif isinstance(v, float):
-            if not math.isfinite(v):
-                errors.append(f"{p}: non-finite float {v}")
-            return
-
-        elif isinstance(v, dict):
-            for k, subv in v.items():
-                if not isinstance(k, str):
-                    warnings.append(f"{p}: non-string key. Not recommended for YAML {k}")
-                _walk(subv, f"{p}.{k}")
-            return
+def validate_json(data, path="$") -> list:
+    errors, _ = _walk(data, path, _JSON_HANDLERS, _invalid_h)
+    return errors
 
-        elif isinstance(v, list):
-            for i, subv in enumerate(v):
-                _walk(subv, f"{p}[{i}]")
-            return
-        else:
-            errors.append(f"{p}: {v!r} (type {type(v).__name__}) is not a valid YAML value")
+def validate_toml(data, path="$") -> list:
+    return _walk(data, path, _TOML_HANDLERS, _invalid_h)
 
-    _walk(data, path)
-    return errors, warnings
+def validate_yaml(data, path="$") -> list:
+    return _walk(data, path, _YAML_HANDLERS, _yaml_invalid_h)
 
 def validate_xml(data, path="$") -> list:
-    errors = []
-    import math
-    def _walk(v, p):
-        nonlocal errors
-
-        if isinstance(v, dict):
-            for k, subv in v.items():
-                if not isinstance(k, str):
-                    errors.append(f"{p}: non-string key {k!r} (XML tag/attr must be str)")
-                _walk(subv, f"{p}.{k}")
-            return
-
-        elif isinstance(v, list):
-            for i, subv in enumerate(v):
-                _walk(subv, f"{p}[{i}]")
-            return
-        
-        try:
-            _ = str(v)
-        except Exception as e:
-            errors.append(
-                f"{p}: value {v!r} (type {type(v).__name__}) "
-                f"is not convertible to string for XML: {e}"
-            )
-    _walk(data, path)
+    errors, _ = _walk(data, path, _XML_HANDLERS, _xml_leaf_h)
     return errors
 
 def validate(data, target_format: str):
@@ -210,13 +319,24 @@ def validate(data, target_format: str):
 
 
 # 4. conditioning
+@functools.lru_cache(maxsize=256)
+def _compile(expression: str):
+    # parsing the jsonpath is the expensive part, so reuse compiled expressions
+    return parse(expression)
+
+
 def smart_condition(data, expression: str):
     try:
-        return [m.value for m in parse(expression).find(data)]
+        return [m.value for m in _compile(expression).find(data)]
     except Exception as e:
         raise ValueError(f"Invalid expression: {expression}")
 
+# 4.1 no streamed selections: old_main stays on smart_condition
+
 # 4.5 remake conditioning similarly to sql language
+# draft only: nothing here builds a Lark parser and the grammar below does not
+# compile. the working version is src/parser.py, which needs no parser tables
+# and shares one QueryParser via get_parser(), so there is nothing to cache
 
 QUERY_GRAMMAR = r"""
 ?start: query
@@ -253,6 +373,9 @@ FALSE: "false"
 """
 
 
+# if this is ever revived, pass it as Lark(..., parser="lalr", transformer=...)
+# so reductions run inline instead of building and re-walking a Tree. that
+# also makes Transformer_InPlace/_NonRecursive moot, there is no tree to reuse
 class QueryTransformer(Transformer):
     def NAME(self, token):
         return token.value
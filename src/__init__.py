@@ -18,37 +18,91 @@ Example:
 __version__ = "0.1.0"
 __author__ = "thaisya"
 
-# Public API exports
-from src.io import (
-    DataConverterIOError,
-    FileFormat,
-    FileLoadError,
-    FileSaveError,
-    UnsupportedFormatError,
-    detect_format,
-    smart_load,
-    smart_save,
-)
-from src.parser import (
-    Condition,
-    ParseError,
-    PathSpec,
-    QueryParser,
-    QueryResult,
-)
-from src.processor import (
-    ProcessorError,
-    apply_conditions,
-    apply_path,
-    process_data,
-)
-from src.validation import (
-    ValidationError,
-    ValidationIssue,
-    ValidationResult,
-    format_validation_report,
-    validate,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.io import (
+        DataConverterIOError,
+        FileFormat,
+        FileLoadError,
+        FileSaveError,
+        UnsupportedFormatError,
+        detect_format,
+        smart_load,
+        smart_save,
+    )
+    from src.parser import (
+        Condition,
+        ParseError,
+        PathSpec,
+        QueryParser,
+        QueryResult,
+    )
+    from src.processor import (
+        ProcessorError,
+        apply_conditions,
+        apply_path,
+        process_data,
+    )
+    from src.validation import (
+        ValidationError,
+        ValidationIssue,
+        ValidationResult,
+        format_validation_report,
+        validate,
+        validate_into,
+    )
+
+# Public API exports, resolved lazily on first access (PEP 562) so importing the
+# package (e.g. for __version__ or the CLI entry point) doesn't pull in every
+# format library and the query grammar up front.
+_LAZY_EXPORTS: dict[str, str] = {
+    # I/O
+    "smart_load": "src.io",
+    "smart_save": "src.io",
+    "detect_format": "src.io",
+    "FileFormat": "src.io",
+    "DataConverterIOError": "src.io",
+    "FileLoadError": "src.io",
+    "FileSaveError": "src.io",
+    "UnsupportedFormatError": "src.io",
+    # Parser
+    "QueryParser": "src.parser",
+    "QueryResult": "src.parser",
+    "PathSpec": "src.parser",
+    "Condition": "src.parser",
+    "ParseError": "src.parser",
+    # Processor
+    "apply_path": "src.processor",
+    "apply_conditions": "src.processor",
+    "process_data": "src.processor",
+    "ProcessorError": "src.processor",
+    # Validation
+    "validate": "src.validation",
+    "validate_into": "src.validation",
+    "ValidationResult": "src.validation",
+    "ValidationIssue": "src.validation",
+    "ValidationError": "src.validation",
+    "format_validation_report": "src.validation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public API members on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily exported names."""
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Version info
@@ -76,6 +130,7 @@ __all__ = [
     "ProcessorError",
     # Validation
     "validate",
+    "validate_into",
     "ValidationResult",
     "ValidationIssue",
     "ValidationError",
@@ -15,26 +15,64 @@ Example:
     [+] Converted and saved to output.yaml
 """
 
+import functools
 import logging
 import re
 import sys
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 from rich.console import Console
 from rich.logging import RichHandler
-from rich.panel import Panel
-from rich.table import Table
+from rich.text import Text
 
 from src import __version__
-from src.io import DataConverterIOError, detect_format, smart_load, smart_save
-from src.parser import ParseError, QueryParser
-from src.processor import ProcessorError, apply_path, apply_conditions
-from src.validation import ValidationError, format_validation_report, validate
-
-# Initialize Rich console
+from src.io import (
+    DataConverterIOError,
+    FileFormat,
+    detect_format,
+    smart_load,
+    smart_save,
+)
+from src.validation import (
+    ItemValidator,
+    ValidationError,
+    ValidationResult,
+    format_validation_report,
+    validate,
+)
+
+# Single Rich console shared by every command. Table/Panel, the query parser
+# and the processor (jsonpath-ng) are only needed by a few commands and are
+# imported there to keep REPL startup fast.
 console = Console()
 
+# Case-insensitive prefix checks without lowercasing the whole input
+_QUERY_RE = re.compile(r"\s*from\b", re.IGNORECASE)
+_CONVERT_TO_RE = re.compile(r"to\s", re.IGNORECASE)
+
+
+@functools.cache
+def _welcome_banner() -> Text:
+    """Render the welcome banner once; it is constant for the process."""
+    ascii_art = f"""
+╭────────────────────────────────── Interactive Data Converter ──────────────────────────────────╮
+│                                                                                                │
+│   ██████╗  █████╗ ████████╗ █████╗  ██████╗ ██████╗ ███╗   ██╗██╗   ██╗                        │
+│   ██╔══██╗██╔══██╗╚══██╔══╝██╔══██╗██╔════╝██╔═══██╗████╗  ██║██║   ██║                        │
+│   ██║  ██║███████║   ██║   ███████║██║     ██║   ██║██╔██╗ ██║██║   ██║                        │
+│   ██║  ██║██╔══██║   ██║   ██╔══██║██║     ██║   ██║██║╚██╗██║╚██╗ ██╔╝                        │
+│   ██████╔╝██║  ██║   ██║   ██║  ██║╚██████╗╚██████╔╝██║ ╚████║ ╚████╔╝                         │
+│   ╚═════╝ ╚═╝  ╚═╝   ╚═╝   ╚═╝  ╚═╝ ╚═════╝ ╚═════╝ ╚═╝  ╚═══╝  ╚═══╝                          │
+│                                                                                                │
+│   Version: {__version__}                                                                               │
+│   Type 'help' for commands, 'exit' to quit.                                                    │
+│                                                                                                │
+╰────────────────────────────────────────────────────────────────────────────────────────────────╯
+    """
+    return console.render_str(f"[cyan]{ascii_art}[/cyan]")
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging with Rich handler.
@@ -59,12 +97,27 @@ class InteractiveCLI:
 
     Attributes:
         current_file: Path to currently loaded file
-        current_data: The loaded data
+        current_data: The loaded data (assigning it drops cached validation results)
         current_format: Detected format of current file
         verbose: Whether verbose logging is enabled
         running: Whether the REPL loop is active
     """
 
+    # Command name -> handler method, built once for the class
+    _COMMANDS: dict[str, str] = {
+        "load": "_cmd_load",
+        "save": "_cmd_save",
+        "convert": "_cmd_convert",
+        "show": "_cmd_show",
+        "status": "_cmd_status",
+        "validate": "_cmd_validate",
+        "help": "_cmd_help",
+        "exit": "_cmd_exit",
+        "quit": "_cmd_exit",
+        "bye": "_cmd_exit",
+        "clear": "_cmd_clear",
+    }
+
     def __init__(self, verbose: bool = False) -> None:
         """Initialize the interactive CLI.
 
@@ -72,7 +125,8 @@ class InteractiveCLI:
             verbose: Enable verbose logging
         """
         self.current_file: Path | None = None
-        self.current_data: Any = None
+        self._current_data: Any = None
+        self._validation_cache: dict[FileFormat, ValidationResult] = {}
         self.current_format: str | None = None
         self.verbose = verbose
         self.running = True
@@ -80,6 +134,44 @@ class InteractiveCLI:
 
         setup_logging(verbose)
 
+    @property
+    def current_data(self) -> Any:
+        """The currently loaded data."""
+        return self._current_data
+
+    @current_data.setter
+    def current_data(self, data: Any) -> None:
+        self._current_data = data
+        self._validation_cache.clear()
+
+    def _validate_cached(
+        self, data: Any, target_format: FileFormat
+    ) -> ValidationResult:
+        """Validate data, reusing earlier results for the loaded data.
+
+        Validation is pure, so repeated convert/validate commands on the same
+        loaded data skip the tree walk. Only ``current_data`` itself is cached;
+        the cache is dropped whenever new data is assigned.
+
+        Args:
+            data: Data to validate
+            target_format: Format to validate against
+
+        Returns:
+            ValidationResult with errors and warnings
+        """
+        if data is not self._current_data:
+            return validate(data, target_format)
+
+        result = self._validation_cache.get(target_format)
+        if result is None:
+            result = validate(data, target_format)
+            self._validation_cache[target_format] = result
+            self.logger.debug(f"Validation cache miss for {target_format.value}")
+        else:
+            self.logger.debug(f"Validation cache hit for {target_format.value}")
+        return result
+
     def run(self) -> None:
         """Start the interactive REPL loop."""
         self._print_welcome()
@@ -102,51 +194,29 @@ class InteractiveCLI:
 
     def _print_welcome(self) -> None:
         """Print welcome message."""
-        ascii_art = f"""
-╭────────────────────────────────── Interactive Data Converter ──────────────────────────────────╮
-│                                                                                                │
-│   ██████╗  █████╗ ████████╗ █████╗  ██████╗ ██████╗ ███╗   ██╗██╗   ██╗                        │
-│   ██╔══██╗██╔══██╗╚══██╔══╝██╔══██╗██╔════╝██╔═══██╗████╗  ██║██║   ██║                        │
-│   ██║  ██║███████║   ██║   ███████║██║     ██║   ██║██╔██╗ ██║██║   ██║                        │
-│   ██║  ██║██╔══██║   ██║   ██╔══██║██║     ██║   ██║██║╚██╗██║╚██╗ ██╔╝                        │
-│   ██████╔╝██║  ██║   ██║   ██║  ██║╚██████╗╚██████╔╝██║ ╚████║ ╚████╔╝                         │
-│   ╚═════╝ ╚═╝  ╚═╝   ╚═╝   ╚═╝  ╚═╝ ╚═════╝ ╚═════╝ ╚═╝  ╚═══╝  ╚═══╝                          │
-│                                                                                                │
-│   Version: {__version__}                                                                               │
-│   Type 'help' for commands, 'exit' to quit.                                                    │
-│                                                                                                │
-╰────────────────────────────────────────────────────────────────────────────────────────────────╯
-        """
-        console.print(f"[cyan]{ascii_art}[/cyan]")
+        console.print(_welcome_banner())
 
     def _execute_command(self, user_input: str) -> None:
         """Parse and execute a user command or query.
 
         Args:
-            user_input: Raw user input string
+            user_input: User input, already stripped by run()
         """
         # Check if input is a query (starts with 'from')
-        if user_input.strip().lower().startswith('from'):
+        if _QUERY_RE.match(user_input):
             self._execute_query(user_input)
             return
 
-        # Otherwise treat as helper command
+        # Otherwise treat as helper command. split() drops the whitespace
+        # between command and args, so handlers get args already trimmed.
         parts = user_input.split(maxsplit=1)
         command = parts[0].lower()
         args = parts[1] if len(parts) > 1 else ""
 
-        # Simplified command dispatch
-        commands = {
-            "help": self._cmd_help,
-            "exit": self._cmd_exit,
-            "quit": self._cmd_exit,
-            "bye": self._cmd_exit,
-            "clear": self._cmd_clear,
-        }
-
-        if command in commands:
+        handler_name = self._COMMANDS.get(command)
+        if handler_name is not None:
             try:
-                commands[command](args)
+                getattr(self, handler_name)(args)
             except Exception as e:
                 console.print(f"[red][X] Error: {e}[/red]")
                 self.logger.exception("Command execution failed")
@@ -161,9 +231,12 @@ class InteractiveCLI:
         Args:
             query: Full query string (e.g., "from data.json[users.*] to out.yaml where age > 25")
         """
+        from src.parser import ParseError, get_parser
+        from src.processor import apply_path, process_data
+
         try:
             # Parse the query
-            parser = QueryParser()
+            parser = get_parser()
             parsed_query = parser.parse(query)
 
             # Extract components
@@ -176,28 +249,40 @@ class InteractiveCLI:
             console.print(f"[cyan]Loading: {source_file}[/cyan]")
             data = smart_load(source_file)
 
-            # Apply path extraction if specified
             if source_path:
                 console.print(f"[cyan]Extracting path: [{source_path}][/cyan]")
-                data = apply_path(data, source_path)
 
-            # Apply conditions if specified
+            # Apply conditions if specified, filtering the path matches
+            # directly and validating them in the same pass
+            target_format = detect_format(dest_file)
             if conditions:
                 console.print(f"[cyan]Applying {len(conditions)} filter(s)...[/cyan]")
-                data = apply_conditions(data if isinstance(data, list) else [data], conditions)
-
-            # Validate before saving
-            target_format = detect_format(dest_file)
-            validation_result = validate(data, target_format)
+                item_validator = ItemValidator(target_format)
+                data = process_data(data, source_path, conditions, item_validator)
+                validation_result = item_validator.finish(data)
+            else:
+                data = apply_path(data, source_path)
+                validation_result = validate(data, target_format)
 
+            # One print per block: Rich writes to the terminal on every call
             if validation_result.warnings:
-                for warning in validation_result.warnings:
-                    console.print(f"[yellow][!] {warning.message}[/yellow]")
+                console.print(
+                    "\n".join(
+                        f"[yellow][!] {warning.message}[/yellow]"
+                        for warning in validation_result.warnings
+                    )
+                )
 
             if validation_result.errors:
-                console.print("[red]Validation failed:[/red]")
-                for error in validation_result.errors:
-                    console.print(f"[red]  [X] {error.message}[/red]")
+                console.print(
+                    "\n".join(
+                        ["[red]Validation failed:[/red]"]
+                        + [
+                            f"[red]  [X] {error.message}[/red]"
+                            for error in validation_result.errors
+                        ]
+                    )
+                )
                 return
 
             # Handle list data for TOML/XML (requires dict root)
@@ -216,9 +301,10 @@ class InteractiveCLI:
             # Save to destination
             smart_save(data, dest_file, atomic=True)
 
-            # Update state
+            # Update state, reusing the format detected for the destination
             self.current_data = data
             self.current_file = dest_file
+            self.current_format = target_format.value
 
             # Success message
             record_count = self._count_records(data)
@@ -240,7 +326,7 @@ class InteractiveCLI:
             console.print("[red]Usage: load <file_path>[/red]")
             return
 
-        file_path = Path(args.strip())
+        file_path = Path(args)
 
         if not file_path.exists():
             console.print(f"[red][X] File not found: {file_path}[/red]")
@@ -275,7 +361,7 @@ class InteractiveCLI:
             console.print("[red][X] No data loaded. Use 'load <file>' first.[/red]")
             return
 
-        file_path = Path(args.strip())
+        file_path = Path(args)
 
         try:
             smart_save(self.current_data, file_path, atomic=True)
@@ -303,7 +389,7 @@ class InteractiveCLI:
 
         # Parse the convert command
         # Expected format: "to <file> [where <conditions>]"
-        if not args.lower().startswith("to "):
+        if not _CONVERT_TO_RE.match(args):
             console.print("[red]Usage: convert to <file> [where <conditions>][/red]")
             return
 
@@ -313,8 +399,11 @@ class InteractiveCLI:
         source_path_str = str(source_file).replace("\\", "/")
         query = f"from {source_path_str} {args}"
 
+        from src.parser import ParseError, get_parser
+        from src.processor import ProcessorError, process_data
+
         try:
-            parser = QueryParser()
+            parser = get_parser()
             parsed_query = parser.parse(query)
 
             dest_file = Path(parsed_query["dest"]["file"])
@@ -328,36 +417,59 @@ class InteractiveCLI:
 
             # Start with current data
             data = self.current_data
+            target_format = detect_format(dest_file)
+
+            # Filtered records are validated as they are matched, so the
+            # result doesn't need a second walk
+            try:
+                item_validator = ItemValidator(target_format) if conditions else None
+            except ValidationError as e:
+                console.print(f"[red][X] Validation error: {e}[/red]")
+                return
 
             # Apply path and conditions if specified
             source_path = parsed_query["source"]["path"]
             if source_path or conditions:
                 try:
-                    data = process_data(data, source_path, conditions)
+                    data = process_data(data, source_path, conditions, item_validator)
                 except ProcessorError as e:
                     console.print(f"[red][X] Processing error: {e}[/red]")
                     return
 
             # Validate for target format
             try:
-                target_format = detect_format(dest_file)
-                validation_result = validate(data, target_format)
+                if item_validator is not None:
+                    validation_result = item_validator.finish(data)
+                else:
+                    validation_result = self._validate_cached(data, target_format)
             except ValidationError as e:
                 console.print(f"[red][X] Validation error: {e}[/red]")
                 return
 
             # Display validation warnings
             if validation_result.warnings:
-                console.print("[yellow][!] Validation Warnings:[/yellow]")
-                for warning in validation_result.warnings:
-                    console.print(f"  • [{warning.path}] {warning.message}")
+                console.print(
+                    "\n".join(
+                        ["[yellow][!] Validation Warnings:[/yellow]"]
+                        + [
+                            f"  • [{issue.path}] {issue.message}"
+                            for issue in validation_result.warnings
+                        ]
+                    )
+                )
 
             if validation_result.errors:
-                console.print("[red][X] Validation Errors:[/red]")
-                for error in validation_result.errors:
-                    console.print(f"  • [{error.path}] {error.message}")
                 console.print(
-                    "[red]Aborting due to validation errors. Fix the issues above.[/red]"
+                    "\n".join(
+                        ["[red][X] Validation Errors:[/red]"]
+                        + [
+                            f"  • [{issue.path}] {issue.message}"
+                            for issue in validation_result.errors
+                        ]
+                        + [
+                            "[red]Aborting due to validation errors. Fix the issues above.[/red]"
+                        ]
+                    )
                 )
                 return
 
@@ -401,22 +513,27 @@ class InteractiveCLI:
             console.print("[red][X] No data loaded. Use 'load <file>' first.[/red]")
             return
 
+        from rich.panel import Panel
+
         limit = 10
-        if args.strip().isdigit():
-            limit = int(args.strip())
+        if args.isdigit():
+            limit = int(args)
 
         console.print(Panel(f"[cyan]Data Preview (limit: {limit})[/cyan]"))
 
+        # islice touches only the shown entries, not the whole data set
         if isinstance(self.current_data, list):
-            for i, item in enumerate(self.current_data[:limit]):
+            for i, item in enumerate(islice(self.current_data, limit)):
                 console.print(f"[dim]{i + 1}.[/dim] {item}")
-            if len(self.current_data) > limit:
-                console.print(f"[dim]... and {len(self.current_data) - limit} more[/dim]")
+            remaining = len(self.current_data) - limit
+            if remaining > 0:
+                console.print(f"[dim]... and {remaining} more[/dim]")
         elif isinstance(self.current_data, dict):
-            for i, (key, value) in enumerate(list(self.current_data.items())[:limit]):
+            for key, value in islice(self.current_data.items(), limit):
                 console.print(f"[cyan]{key}:[/cyan] {value}")
-            if len(self.current_data) > limit:
-                console.print(f"[dim]... and {len(self.current_data) - limit} more keys[/dim]")
+            remaining = len(self.current_data) - limit
+            if remaining > 0:
+                console.print(f"[dim]... and {remaining} more keys[/dim]")
         else:
             console.print(self.current_data)
 
@@ -426,6 +543,8 @@ class InteractiveCLI:
         Args:
             args: Unused
         """
+        from rich.table import Table
+
         table = Table(title="Current Status", show_header=False, box=None)
         table.add_column("Property", style="cyan")
         table.add_column("Value")
@@ -449,12 +568,10 @@ class InteractiveCLI:
             console.print("[red][X] No data loaded. Use 'load <file>' first.[/red]")
             return
 
-        from src.io import FileFormat
-
         # Determine target format
-        if args.strip():
+        if args:
             try:
-                target_format = FileFormat(args.strip().lower())
+                target_format = FileFormat(args.lower())
             except ValueError:
                 console.print(
                     f"[red][X] Invalid format: {args}. Valid: json, toml, yaml, xml[/red]"
@@ -469,7 +586,7 @@ class InteractiveCLI:
         console.print(f"Validating for [cyan]{target_format.value.upper()}[/cyan]...")
 
         try:
-            validation_result = validate(self.current_data, target_format)
+            validation_result = self._validate_cached(self.current_data, target_format)
             report = format_validation_report(validation_result)
             console.print(report)
         except ValidationError as e:
@@ -481,6 +598,8 @@ class InteractiveCLI:
         Args:
             args: Unused
         """
+        from rich.table import Table
+
         help_table = Table(title="Available Commands", show_header=True)
         help_table.add_column("Command", style="cyan")
         help_table.add_column("Description")
@@ -546,8 +665,8 @@ class InteractiveCLI:
         Returns:
             Number of records
         """
-        if isinstance(data, list):
+        # Exact type check first: loaders always produce plain lists
+        if type(data) is list or isinstance(data, list):
             return len(data)
-        else:
-            return 1
+        return 1
 
@@ -1,8 +1,10 @@
 """Grammar definitions for the Data Converter query language.
 
-This module contains the Lark grammar for parsing data conversion queries.
-The query language allows specifying source and destination files with optional
-JSONPath expressions and conditional filters.
+This module contains the grammar of the data conversion query language, in Lark
+notation. It is the reference for the hand-written parser in src/parser.py; the
+tests check both accept the same queries. The query language allows specifying
+source and destination files with optional JSONPath expressions and conditional
+filters.
 
 Grammar Syntax:
     from <source_file>[path.expression.*] to <dest_file> where field == value and ...
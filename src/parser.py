@@ -1,7 +1,8 @@
 """Parser and transformer for the Data Converter query language.
 
 This module provides parsing capabilities for the data conversion query syntax
-using Lark parser. It transforms the parse tree into typed Python data structures.
+using a hand-written recursive-descent parser for the grammar in src/grammar.py.
+Queries are parsed directly into typed Python data structures.
 
 Example:
     >>> from src.parser import QueryParser
@@ -11,13 +12,11 @@ Example:
     'input.json'
 """
 
+import functools
 import logging
+import re
 from typing import Any, TypedDict
 
-from lark import Lark, Token, Transformer
-
-from src.grammar import QUERY_GRAMMAR
-
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +29,9 @@ class ParseError(Exception):
 class Condition(TypedDict):
     """Represents a single filter condition.
 
+    Conditions are read once per query by compile_conditions, never per row,
+    so a plain dict costs nothing in the filter loop.
+
     Attributes:
         field: The field name to filter on
         op: The comparison operator (==, !=, >, <, >=, <=)
@@ -67,141 +69,185 @@ class QueryResult(TypedDict):
     conditions: list[Condition]
 
 
-class QueryTransformer(Transformer):
-    """Transforms Lark parse tree into typed Python structures.
-
-    This class inherits from Lark's Transformer and implements methods
-    to convert each grammar rule into appropriate Python types.
+# Terminals of the query grammar (see src/grammar.py). The reader is
+# contextual like an LALR lexer: at each point it only tries the terminals the
+# grammar allows there, so e.g. "to" is a valid file name after "from".
+_WS = re.compile(r"[ \t\f\r\n]*")
+_FILE = re.compile(r"[a-zA-Z0-9_\-/.]+")
+_NAME = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
+_ESCAPED_STRING = re.compile(r'".*?(?<!\\)(\\\\)*?"')
+_SIGNED_NUMBER = re.compile(
+    r"[+-]?(?:[0-9]+[eE][+-]?[0-9]+|(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?|[0-9]+)"
+)
+# A slice-and-set-lookup scanner measured no faster than this anchored match
+_OP = re.compile(r"==|!=|>=|<=|>|<")
+_KEYWORD_VALUES: tuple[tuple[str, Any], ...] = (
+    ("true", True),
+    ("false", False),
+    ("null", None),
+)
+
+
+class _QueryReader:
+    """Recursive-descent parser for a single query string.
+
+    Implements the grammar in src/grammar.py directly, one method per rule,
+    producing the same results the grammar's parse tree would transform to.
     """
 
-    def NAME(self, token: Token) -> str:
-        """Transform NAME token to string."""
-        return str(token.value)
-
-    def ESCAPED_STRING(self, token: Token) -> str:
-        """Transform ESCAPED_STRING token to string (removes quotes)."""
-        return str(token.value[1:-1])
-
-    def SIGNED_NUMBER(self, token: Token) -> float:
-        """Transform SIGNED_NUMBER token to float."""
-        return float(token.value)
-
-    def TRUE(self, token: Token) -> bool:
-        """Transform TRUE token to boolean True."""
-        return True
-
-    def FALSE(self, token: Token) -> bool:
-        """Transform FALSE token to boolean False."""
-        return False
-
-    def NULL(self, token: Token) -> None:
-        """Transform NULL token to None."""
-        return None
-
-    def field(self, children: list[Any]) -> str:
-        """Transform field rule to field name string.
-        
-        Args:
-            children: List containing [NAME]
-            
-        Returns:
-            Field name as string
-        """
-        return str(children[0])
-
-    def value(self, children: list[Any]) -> Any:
-        """Transform value rule to actual value.
-        
-        Args:
-            children: List containing one of [ESCAPED_STRING, SIGNED_NUMBER, TRUE, FALSE, NULL]
-            
-        Returns:
-            The actual value (string, number, bool, or None)
-        """
-        return children[0]
-
-    def OP(self, token: Token) -> str:
-        """Transform OP token to operator string."""
-        return str(token.value)
-
-    def array_wildcard(self, token: Token) -> str:
-        """Transform array_wildcard token to string."""
-        return "*"
-
-    def condition(self, children: list[Any]) -> Condition:
-        """Transform condition rule to Condition TypedDict.
+    def __init__(self, text: str) -> None:
+        """Initialize the reader at the start of the query.
 
         Args:
-            children: List containing [field_name, op, value]
-
-        Returns:
-            Condition dictionary with field, op, and value
+            text: The query string to parse
         """
-        # Children are: [field_name (str), op (str), value (primitive)]
-        return {"field": children[0], "op": children[1], "value": children[2]}
-
-    def condition_list(self, children: list[Condition]) -> list[Condition]:
-        """Transform condition_list to list of Conditions."""
-        return children
-
-    def file_path(self, children: list[Any]) -> PathSpec:
-        """Transform file_path rule to PathSpec.
-
-        Args:
-            children: List containing [file] or [file, path]
+        self._text = text
+        self._pos = 0
+
+    def _error(self, expected: str) -> ParseError:
+        """Build an error for unexpected input at the current position."""
+        found = self._text[self._pos : self._pos + 20] or "end of query"
+        return ParseError(f"Expected {expected} at position {self._pos}, got {found!r}")
+
+    def _skip_ws(self) -> None:
+        """Skip whitespace, which may appear between any two terminals."""
+        self._pos = _WS.match(self._text, self._pos).end()  # type: ignore[union-attr]
+
+    def _match(self, pattern: re.Pattern[str]) -> str | None:
+        """Consume a terminal matching pattern after optional whitespace."""
+        self._skip_ws()
+        match = pattern.match(self._text, self._pos)
+        if match is None:
+            return None
+        self._pos = match.end()
+        return match.group()
+
+    def _keyword(self, keyword: str) -> bool:
+        """Consume a keyword/punctuation literal after optional whitespace."""
+        self._skip_ws()
+        if self._text.startswith(keyword, self._pos):
+            self._pos += len(keyword)
+            return True
+        return False
 
-        Returns:
-            PathSpec dictionary with file and optional path
-        """
-        file = str(children[0])
-        path = children[1] if len(children) > 1 else None
+    def _expect_keyword(self, keyword: str) -> None:
+        """Consume a keyword literal or raise ParseError."""
+        if not self._keyword(keyword):
+            raise self._error(f"'{keyword}'")
+
+    def query(self) -> QueryResult:
+        """query: "from" file_path "to" file_path ("where" condition_list)?"""
+        self._expect_keyword("from")
+        source = self.file_path()
+        self._expect_keyword("to")
+        dest = self.file_path()
+        conditions = self.condition_list() if self._keyword("where") else []
+
+        self._skip_ws()
+        if self._pos != len(self._text):
+            raise self._error("end of query")
+
+        return {"source": source, "dest": dest, "conditions": conditions}
+
+    def file_path(self) -> PathSpec:
+        """file_path: (FILE | ESCAPED_STRING) path_bracket?"""
+        quoted = self._match(_ESCAPED_STRING)
+        if quoted is not None:
+            file = quoted[1:-1]
+        else:
+            file = self._match(_FILE)  # type: ignore[assignment]
+            if file is None:
+                raise self._error("file path")
+
+        path = None
+        if self._keyword("["):
+            path = self.path_expression()
+            self._expect_keyword("]")
         return {"file": file, "path": path}
 
-    def path_bracket(self, children: list[Any]) -> str:
-        """Transform path_bracket to path expression string.
-
-        Args:
-            children: List containing the path expression
-
-        Returns:
-            Path expression string
-        """
-        return str(children[0])
-
-    def path_expression(self, children: list[Any]) -> str:
-        """Transform path_expression to dot-separated string.
-
-        Args:
-            children: List of name components and optional wildcard
-
-        Returns:
-            Dot-separated path string (e.g., "users.name" or "users.*")
-        """
-        parts = [str(c) for c in children if str(c) != "."]
-
+    def path_expression(self) -> str:
+        """path_expression: NAME ("." NAME)* ("." "*")?"""
+        parts = [self._name()]
+        while self._keyword("."):
+            if self._keyword("*"):
+                parts.append("*")
+                break
+            parts.append(self._name())
         return ".".join(parts)
 
-    def query(self, children: list[Any]) -> QueryResult:
-        """Transform query rule to QueryResult.
+    def condition_list(self) -> list[Condition]:
+        """condition_list: condition ("and" condition)*"""
+        conditions = [self.condition()]
+        while self._keyword("and"):
+            conditions.append(self.condition())
+        return conditions
+
+    def condition(self) -> Condition:
+        """condition: field OP value"""
+        field = self._name()
+        op = self._match(_OP)
+        if op is None:
+            raise self._error("comparison operator")
+        return {"field": field, "op": op, "value": self.value()}
+
+    def value(self) -> Any:
+        """value: ESCAPED_STRING | SIGNED_NUMBER | TRUE | FALSE | NULL"""
+        quoted = self._match(_ESCAPED_STRING)
+        if quoted is not None:
+            return quoted[1:-1]
+
+        number = self._match(_SIGNED_NUMBER)
+        if number is not None:
+            return float(number)
+
+        for keyword, value in _KEYWORD_VALUES:
+            if self._keyword(keyword):
+                return value
+
+        raise self._error("value (string, number, true, false or null)")
+
+    def _name(self) -> str:
+        """Consume a NAME terminal or raise ParseError."""
+        name = self._match(_NAME)
+        if name is None:
+            raise self._error("name")
+        return name
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_query(query: str) -> QueryResult:
+    """Parse a query string, memoized by query text.
+
+    Args:
+        query: The query string to parse
+
+    Returns:
+        Parsed query result. The cached object is shared between calls and
+        must not be mutated; QueryParser.parse hands out copies.
+    """
+    return _QueryReader(query).query()
 
-        Args:
-            children: List containing source path, dest path, and optional conditions
 
-        Returns:
-            QueryResult dictionary
-        """
-        return {
-            "source": children[0],
-            "dest": children[1],
-            "conditions": children[2] if len(children) > 2 else [],
-        }
+def _copy_result(result: QueryResult) -> QueryResult:
+    """Copy a cached query result so callers can't mutate the cache.
+
+    All leaf values are immutable (str, float, bool, None), so copying the
+    dicts and the condition list is enough and much cheaper than deepcopy.
+    """
+    return {
+        "source": PathSpec(**result["source"]),
+        "dest": PathSpec(**result["dest"]),
+        "conditions": [Condition(**cond) for cond in result["conditions"]],
+    }
 
 
 class QueryParser:
     """Parser for data conversion queries.
 
-    This class encapsulates the Lark parser and transformer for parsing
-    data conversion query strings.
+    Queries are parsed by a small hand-written recursive-descent parser for
+    the grammar in src/grammar.py. No parser tables are built, so there is no
+    cold-start cost to cache. Parse results are memoized by query string, so
+    repeated queries in the interactive CLI skip parsing entirely.
 
     Example:
         >>> parser = QueryParser()
@@ -211,9 +257,7 @@ class QueryParser:
     """
 
     def __init__(self) -> None:
-        """Initialize the query parser with grammar and transformer."""
-        self._parser = Lark(QUERY_GRAMMAR, parser="lalr")
-        self._transformer = QueryTransformer()
+        """Initialize the query parser."""
         logger.debug("QueryParser initialized")
 
     def parse(self, query: str) -> QueryResult:
@@ -235,10 +279,21 @@ class QueryParser:
         """
         try:
             logger.debug(f"Parsing query: {query}")
-            tree = self._parser.parse(query)
-            result = self._transformer.transform(tree)
+            result = _copy_result(_parse_query(query))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Query cache: {_parse_query.cache_info()}")
             logger.info(f"Successfully parsed query: {query}")
-            return result  # type: ignore
+            return result
         except Exception as e:
             logger.error(f"Failed to parse query '{query}': {e}")
             raise ParseError(f"Invalid query syntax: {e}") from e
+
+
+@functools.lru_cache(maxsize=1)
+def get_parser() -> QueryParser:
+    """Return the shared QueryParser instance.
+
+    Returns:
+        Process-wide QueryParser, created on first use
+    """
+    return QueryParser()
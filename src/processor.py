@@ -15,11 +15,15 @@ Example:
     >>> # filtered = [{'name': 'John', 'age': 30}]
 """
 
+import functools
 import logging
+import operator
+import re
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import Any
 
-from jsonpath_ng import parse
+from jsonpath_ng import JSONPath, parse
 from jsonpath_ng.exceptions import JsonPathParserError
 
 from src.parser import Condition
@@ -44,6 +48,123 @@ class ProcessorConfig:
     strict_mode: bool = False
 
 
+# Paths made of plain field names with an optional trailing wildcard
+# ("users", "config.database.host", "users.*", "users[*]") are by far the most
+# common and are resolved directly, without building a jsonpath-ng expression.
+_SIMPLE_PATH = re.compile(
+    r"([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)(\[\*\]|\.\*)?"
+)
+# ".*" as a whole path segment, written as "[*]" for jsonpath-ng
+_WILDCARD_SEGMENT = re.compile(r"\.\*(?=[.\[]|$)")
+_JSONPATH_RESERVED = frozenset(("where", "wherenot"))
+_NOT_SET = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_path(path: str) -> JSONPath:
+    """Parse a JSONPath expression relative to the root, memoized by path.
+
+    Args:
+        path: Path relative to the root (e.g., "users.*.name", "users[*].name")
+
+    Returns:
+        Compiled jsonpath-ng expression
+
+    Raises:
+        JsonPathParserError: If the expression is invalid
+    """
+    if ".*" in path:
+        path = _WILDCARD_SEGMENT.sub("[*]", path)
+    return parse(f"$.{path}")  # type: ignore[no-any-return]
+
+
+@functools.lru_cache(maxsize=256)
+def _simple_path(path: str) -> tuple[tuple[str, ...], bool] | None:
+    """Split a simple path into field names and wildcard flag, memoized by path.
+
+    Args:
+        path: Path relative to the root
+
+    Returns:
+        (names, wildcard) for paths _find_simple_path can resolve, else None
+    """
+    simple = _SIMPLE_PATH.fullmatch(path)
+    if simple is None or not _JSONPATH_RESERVED.isdisjoint(path.split(".")):
+        return None
+    return tuple(simple.group(1).split(".")), bool(simple.group(2))
+
+
+def _find_simple_path(data: Any, names: tuple[str, ...], wildcard: bool) -> list[Any]:
+    """Resolve a simple path the way jsonpath-ng's Fields/Slice would.
+
+    Args:
+        data: Source data
+        names: Field names to descend into
+        wildcard: Whether the path ends with [*]
+
+    Returns:
+        List of matched values (empty if nothing matched). For a list under
+        [*] this is the list itself, not a copy.
+    """
+    value = data
+    for name in names:
+        try:
+            value = value.get(name, _NOT_SET)
+        except (TypeError, AttributeError):
+            return []
+        if value is _NOT_SET:
+            return []
+
+    if not wildcard:
+        return [value]
+    if value is None:
+        return []
+    # jsonpath-ng treats a dict or scalar under [*] as a one-element list
+    if isinstance(value, (dict, int, float, str, bool)):
+        return [value]
+    if type(value) is list:
+        return value
+    return [value[i] for i in range(len(value))]
+
+
+def _find_path(data: Any, path: str) -> list[Any]:
+    """Find all values matched by a JSONPath expression.
+
+    Args:
+        data: Source data
+        path: JSONPath expression (non-empty)
+
+    Returns:
+        List of matched values. It may be a list inside ``data`` (e.g. for
+        "users.*"), so it must be copied before being handed out.
+
+    Raises:
+        ProcessorError: If JSONPath expression is invalid
+    """
+    try:
+        logger.debug(f"Applying JSONPath: {path}")
+
+        simple = _simple_path(path)
+        if simple is not None:
+            results = _find_simple_path(data, *simple)
+        else:
+            jsonpath_expr = _compile_path(path)
+            results = [match.value for match in jsonpath_expr.find(data)]
+
+    except JsonPathParserError as e:
+        logger.error(f"Invalid JSONPath expression '{path}': {e}")
+        raise ProcessorError(f"Invalid JSONPath expression '{path}': {e}") from e
+    except Exception as e:
+        logger.error(f"Error applying JSONPath '{path}': {e}")
+        raise ProcessorError(f"Error applying path '{path}': {e}") from e
+
+    if not results:
+        logger.warning(f"JSONPath expression '{path}' matched no results")
+    else:
+        logger.info(f"JSONPath '{path}' matched {len(results)} result(s)")
+    return results
+
+
 def apply_path(data: dict[str, Any], path: str | None) -> Any:
     """Extract data using JSONPath expression.
 
@@ -68,38 +189,31 @@ def apply_path(data: dict[str, Any], path: str | None) -> Any:
         logger.debug("No path specified, returning original data")
         return data
 
-    try:
-        logger.debug(f"Applying JSONPath: {path}")
-        path = path.replace(".*", "[*]")
-        jsonpath_expr = parse(f"$.{path}")
-        matches = jsonpath_expr.find(data)
+    results = _find_path(data, path)
+    if not results:
+        return []
 
-        if not matches:
-            logger.warning(f"JSONPath expression '{path}' matched no results")
-            return []
+    # Return single value if only one match, otherwise return list
+    if len(results) == 1:
+        return results[0]
+    return results[:]
 
-        results = [match.value for match in matches]
 
-        # Return single value if only one match, otherwise return list
-        if len(results) == 1:
-            logger.info(f"JSONPath '{path}' matched 1 result")
-            return results[0]
-        else:
-            logger.info(f"JSONPath '{path}' matched {len(results)} results")
-            return results
-
-    except JsonPathParserError as e:
-        logger.error(f"Invalid JSONPath expression '{path}': {e}")
-        raise ProcessorError(f"Invalid JSONPath expression '{path}': {e}") from e
-    except Exception as e:
-        logger.error(f"Error applying JSONPath '{path}': {e}")
-        raise ProcessorError(f"Error applying path '{path}': {e}") from e
+_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
 
 
 def evaluate_condition(value: Any, op: str, expected: Any) -> bool:
     """Evaluate a single condition.
 
-    Performs type-safe comparison with basic type coercion for numbers.
+    Performs type-safe comparison. Numbers are compared natively, which is
+    exact across int and float, so 30 == 30.0 without any conversion.
 
     Args:
         value: The actual value to check
@@ -124,40 +238,190 @@ def evaluate_condition(value: Any, op: str, expected: Any) -> bool:
             return (value == expected) if op == "==" else (value != expected)
         return False
 
-    # Type coercion for numeric comparisons
+    compare = _OPS.get(op)
+    if compare is None:
+        raise ProcessorError(f"Unsupported operator: {op}")
+
     try:
-        if isinstance(value, (int, float)) and isinstance(expected, (int, float)):
-            value_num = float(value)
-            expected_num = float(expected)
-        else:
-            value_num = value
-            expected_num = expected
-
-        # Perform comparison
-        if op == "==":
-            return value_num == expected_num
-        elif op == "!=":
-            return value_num != expected_num
-        elif op == ">":
-            return value_num > expected_num
-        elif op == "<":
-            return value_num < expected_num
-        elif op == ">=":
-            return value_num >= expected_num
-        elif op == "<=":
-            return value_num <= expected_num
-        else:
-            raise ProcessorError(f"Unsupported operator: {op}")
+        return compare(value, expected)  # type: ignore[no-any-return]
 
     except TypeError as e:
-        logger.warning(
-            f"Type error in condition evaluation: {value} {op} {expected}: {e}"
-        )
+        # Expected for mismatched types and may fire once per row, so it is
+        # only formatted when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Type error in condition evaluation: {value} {op} {expected}: {e}"
+            )
         return False
 
 
+_SUPPORTED_OPS = frozenset(_OPS)
+
+# Evaluation order for AND chains: equality rejects most rows, so it runs
+# first and the predicate exits before the range checks
+_OP_ORDER = {"==": 0, "!=": 1, ">=": 2, "<=": 2, ">": 3, "<": 3}
+
+# How a condition's expected value is compared, see _condition_source
+_KIND_NONE = "none"
+_KIND_NUMBER = "number"
+_KIND_STRING = "string"
+_KIND_OTHER = "other"
+
+# Builtin types whose ordering against a number / a string always raises
+# TypeError. Where a sample of the rows holds them, they are rejected by an
+# exact type check instead of a raise per row (e.g. "age > 25" over XML data,
+# where every value is a str). The check is skipped otherwise, as it costs
+# ~25% on rows that compare fine.
+_UNORDERABLE = {
+    _KIND_NUMBER: frozenset((str, bytes, list, tuple, dict)),
+    _KIND_STRING: frozenset((int, float, bool, bytes, list, tuple, dict)),
+}
+
+ConditionShape = tuple[tuple[str, str], ...]
+Predicate = Callable[[dict[str, Any]], bool]
+MatchCallback = Callable[[int, dict[str, Any]], None]
+
+
+def _value_kind(expected: Any) -> str:
+    """Classify an expected value by how evaluate_condition compares it."""
+    if expected is None:
+        return _KIND_NONE
+    if type(expected) in (int, float, bool):
+        return _KIND_NUMBER
+    if type(expected) is str:
+        return _KIND_STRING
+    return _KIND_OTHER
+
+
+def _condition_source(i: int, op: str, kind: str) -> str:
+    """Generate the boolean expression for one condition over local ``v``.
+
+    Mirrors evaluate_condition: None only supports ==/!=, everything else
+    uses the plain operator. TypeError handling is done once around the whole
+    predicate (see compile_conditions), except for the known unorderable
+    types in _UNORDERABLE, which are checked up front.
+    """
+    if kind == _KIND_NONE:
+        return f"v {op} e{i}" if op in ("==", "!=") else "False"
+
+    none_result = op == "!="
+    if kind in _UNORDERABLE and op not in ("==", "!="):
+        return (
+            f"False if v is None or type(v) in _UNORDERABLE_{kind.upper()} "
+            f"else v {op} e{i}"
+        )
+    return f"{none_result} if v is None else v {op} e{i}"
+
+
+@functools.lru_cache(maxsize=128)
+def _predicate_factory(shape: ConditionShape) -> Callable[..., Predicate]:
+    """Generate a predicate factory for a condition shape (cached).
+
+    The shape is the (op, value kind) of each condition. Field names and
+    values are parameters of the returned factory, so queries that only
+    differ in fields or values share one compiled function, and user input
+    never ends up in generated source (ops come from _SUPPORTED_OPS).
+    Each condition is an early ``return False``; one ``and`` expression over
+    all of them measured slightly slower.
+    """
+    params = ", ".join(f"f{i}, e{i}" for i in range(len(shape)))
+    lines = [f"def _factory({params}):", "    def _match(item):", "        try:"]
+
+    # Fields/values are closure cells, so rows do no condition dict lookups.
+    # Hoisting ``get = item.get`` as well measured slower: 3.11 already
+    # specializes the item.get(...) call. So did fetching all fields with one
+    # operator.itemgetter: it builds a tuple, needs a KeyError fallback for
+    # missing fields and gives up the early exit on the first failing check.
+
+    for i, (op, kind) in enumerate(shape):
+        lines.append(f"            v = item.get(f{i})")
+        lines.append(f"            if not ({_condition_source(i, op, kind)}):")
+        lines.append("                return False")
+
+    lines += [
+        "            return True",
+        "        except TypeError:",
+        "            return False",
+        "    return _match",
+    ]
+
+    namespace: dict[str, Any] = {
+        f"_UNORDERABLE_{kind.upper()}": types for kind, types in _UNORDERABLE.items()
+    }
+    exec(compile("\n".join(lines), "<conditions>", "exec"), namespace)
+    return namespace["_factory"]  # type: ignore[no-any-return]
+
+
+def compile_conditions(
+    conditions: list[Condition], sample: Iterable[Any] = ()
+) -> Predicate:
+    """Compile a list of conditions into a single row predicate.
+
+    The conditions are turned into one generated function, so filtering
+    N records costs N calls instead of re-interpreting every condition per
+    row. Generated code is cached by the operators and value kinds used, so
+    repeated and similar queries only bind new fields/values.
+
+    A row matches when all conditions hold (AND logic), with the same
+    semantics as evaluate_condition: a comparison that raises TypeError
+    counts as not matching. Since the result does not depend on order, the
+    conditions passed by the fewest sample rows are checked first, ties (and
+    all conditions without a sample) by operator (see _OP_ORDER).
+
+    Args:
+        conditions: List of conditions (each has field, op, value)
+        sample: Optional rows representative of the data, used to order the
+            conditions by selectivity. Ordering conditions whose field holds a
+            type in _UNORDERABLE in the sample also reject such rows by type
+            instead of by TypeError. Only affects speed.
+
+    Returns:
+        Predicate taking a record dict and returning True if it matches
+
+    Raises:
+        ProcessorError: If a condition uses an unsupported operator
+
+    Example:
+        >>> match = compile_conditions([{'field': 'age', 'op': '>', 'value': 26}])
+        >>> match({'name': 'John', 'age': 30})
+        True
+    """
+    for cond in conditions:
+        if cond["op"] not in _SUPPORTED_OPS:
+            raise ProcessorError(f"Unsupported operator: {cond['op']}")
+
+    rows = [row for row in sample if isinstance(row, dict)]
+
+    def cost(cond: Condition) -> tuple[int, int]:
+        # Sampled rows the condition passes, so the most selective runs first
+        op, field, expected = cond["op"], cond["field"], cond["value"]
+        passed = sum(evaluate_condition(row.get(field), op, expected) for row in rows)
+        return passed, _OP_ORDER[op]
+
+    # Parsers share one key object between rows (json memoizes keys, orjson
+    # caches them), so looking fields up with that very object lets dict.get
+    # match by identity instead of comparing the strings
+    row_keys = {key: key for row in rows for key in row}
+
+    shape = []
+    args: list[Any] = []
+    for cond in sorted(conditions, key=cost):
+        op, kind, field = cond["op"], _value_kind(cond["value"]), cond["field"]
+        if kind in _UNORDERABLE and (
+            op in ("==", "!=")
+            or not any(type(row.get(field)) in _UNORDERABLE[kind] for row in rows)
+        ):
+            kind = _KIND_OTHER
+        shape.append((op, kind))
+        args += [row_keys.get(field, field), cond["value"]]
+
+    return _predicate_factory(tuple(shape))(*args)
+
+
 def apply_conditions(
-    data: list[dict[str, Any]], conditions: list[Condition]
+    data: list[dict[str, Any]],
+    conditions: list[Condition],
+    on_match: MatchCallback | None = None,
 ) -> list[dict[str, Any]]:
     """Filter list of dictionaries based on conditions.
 
@@ -166,6 +430,9 @@ def apply_conditions(
     Args:
         data: List of dictionaries to filter
         conditions: List of conditions (each has field, op, value)
+        on_match: Optional callback invoked as ``on_match(index, item)`` for
+            each matching item, where index is its position in the result.
+            Lets callers (e.g. validation) work on records in the same pass.
 
     Returns:
         Filtered list containing only items matching all conditions
@@ -187,13 +454,35 @@ def apply_conditions(
 
     logger.debug(f"Applying {len(conditions)} condition(s) to {len(data)} items")
 
-    filtered_results = [
-        item for item in data
-        if isinstance(item, dict) and all(
-            evaluate_condition(item.get(cond["field"]), cond["op"], cond["value"])
-            for cond in conditions
-        )
-    ]
+    # A NumPy mask path was benchmarked here and is not worth it: extracting
+    # columns from a list of dicts costs as much as running the compiled
+    # predicate (~1.2x at best with one condition, slower with two or more).
+    # Object-dtype columns (needed for mixed/missing values) are no help
+    # either: NumPy then calls the Python comparison per element anyway. A
+    # pandas DataFrame has the same problem, and is not a dependency. Plain
+    # column lists with a bytearray mask measured ~3x slower: a row's .get
+    # only touches the looked-up field, so there's no locality to win.
+    # Splitting the rows over a thread pool is no better: the predicate holds
+    # the GIL the whole time, so chunks run one after another plus overhead.
+    # A process pool is worse still: pickling the rows alone takes ~3x as long
+    # as filtering them, and matches would come back as copies, not the rows.
+    match = compile_conditions(conditions, data[:16])
+    if on_match is None:
+        # Extracted records are nearly always all dicts, so skip the per-row
+        # type check and only redo the pass with it if a row has no .get
+        try:
+            filtered_results = [item for item in data if match(item)]
+        except AttributeError:
+            filtered_results = [
+                item for item in data if isinstance(item, dict) and match(item)
+            ]
+    else:
+        filtered_results = []
+        append = filtered_results.append
+        for item in data:
+            if isinstance(item, dict) and match(item):
+                on_match(len(filtered_results), item)
+                append(item)
 
     logger.info(
         f"Filtered {len(data)} items to {len(filtered_results)} "
@@ -207,6 +496,7 @@ def process_data(
     data: dict[str, Any],
     path: str | None,
     conditions: list[Condition],
+    on_match: MatchCallback | None = None,
 ) -> Any:
     """Process data by applying path extraction and conditions.
 
@@ -216,6 +506,8 @@ def process_data(
         data: Source data dictionary
         path: Optional JSONPath expression
         conditions: Optional list of filter conditions
+        on_match: Optional per-match callback, see apply_conditions. Only
+            called when there are conditions to apply.
 
     Returns:
         Processed data (extracted and filtered)
@@ -230,11 +522,16 @@ def process_data(
         f"Processing data with path='{path}' and {len(conditions)} condition(s)"
     )
 
-    # Step 1: Apply path extraction
-    extracted = apply_path(data, path)
-
-    # Step 2: Apply conditions if any (apply_conditions обработает любой тип данных)
-    if conditions:
-        extracted = apply_conditions(extracted, conditions)
-
-    return extracted
+    if not conditions:
+        return apply_path(data, path)
+
+    # Filter the path matches directly instead of apply_path's copy of them.
+    # apply_path unwraps a single match; only a matched list changes what is
+    # filtered, a single dict or scalar is already a one-row list here
+    rows: Any = data
+    if path:
+        rows = _find_path(data, path)
+        if len(rows) == 1 and isinstance(rows[0], list):
+            rows = rows[0]
+
+    return apply_conditions(rows, conditions, on_match)
@@ -13,6 +13,8 @@ Example:
 
 import logging
 import math
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
 from decimal import Decimal
@@ -25,7 +27,11 @@ logger = logging.getLogger(__name__)
 
 
 class Severity(Enum):
-    """Severity level for validation issues."""
+    """Severity level for validation issues.
+
+    Members are singletons, so an issue only holds a reference to one; plain
+    string constants would take the same memory.
+    """
 
     ERROR = "error"
     WARNING = "warning"
@@ -37,7 +43,7 @@ class ValidationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """Represents a single validation issue.
 
@@ -52,10 +58,13 @@ class ValidationIssue:
     severity: Severity = Severity.ERROR
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validation containing errors and warnings.
 
+    Issue messages are interned: invalid data tends to repeat a few messages
+    (e.g. "non-finite float nan") many times, so each is stored only once.
+
     Attributes:
         errors: List of validation errors
         warnings: List of validation warnings
@@ -79,7 +88,7 @@ class ValidationResult:
             path: Path to the problematic data
             message: Error message
         """
-        self.errors.append(ValidationIssue(path, message, Severity.ERROR))
+        self.errors.append(ValidationIssue(path, sys.intern(message), Severity.ERROR))
 
     def add_warning(self, path: str, message: str) -> None:
         """Add a warning to the result.
@@ -88,7 +97,9 @@ class ValidationResult:
             path: Path to the data
             message: Warning message
         """
-        self.warnings.append(ValidationIssue(path, message, Severity.WARNING))
+        self.warnings.append(
+            ValidationIssue(path, sys.intern(message), Severity.WARNING)
+        )
 
 
 class Validator(Protocol):
@@ -107,6 +118,232 @@ class Validator(Protocol):
         ...
 
 
+class _PendingIssue:
+    """Key issue queued on a walk stack, reported when its value is reached.
+
+    Keeps issues in document order: a bad key is reported right before the
+    issues found inside its value, as a recursive walk would.
+    """
+
+    __slots__ = ("report", "message")
+
+    def __init__(self, report: Callable[[str, str], None], message: str) -> None:
+        self.report = report
+        self.message = message
+
+
+class _SharedSubtrees:
+    """Issues of containers the data references from more than one place.
+
+    Data often reuses one dict or list in several places (e.g. a shared
+    template). A walk handles the first reference as usual; other references
+    are validated once more from the container itself, and those issues are
+    copied under each further path instead of walking it again. Reaching a
+    container from inside itself is a cycle.
+
+    Walks only track containers with non-leaf children: the others cannot be
+    part of a cycle and are as cheap to walk again as to copy issues for.
+    """
+
+    __slots__ = ("_walk", "_cycle_message", "_issues", "_active")
+
+    def __init__(
+        self,
+        walk: Callable[[Any, str, ValidationResult, "_SharedSubtrees"], None],
+        cycle_message: str | None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            walk: The validator's _walk method
+            cycle_message: Error reported for circular references, or None if
+                the format can represent them
+        """
+        self._walk = walk
+        self._cycle_message = cycle_message
+        # id -> (errors, warnings) with paths relative to the container
+        self._issues: dict[int, tuple[list, list]] = {}
+        self._active: set[int] = set()
+
+    def revisit(
+        self, value: Any, first: Any, node: Any, result: ValidationResult
+    ) -> None:
+        """Add the issues of a container the walk has already reached.
+
+        Args:
+            value: The container
+            first: Location (parent, sep, name) it was first reached at
+            node: Location it is reached at now
+            result: ValidationResult to accumulate issues
+        """
+        key = id(value)
+        location = node[0]
+        while location is not None:
+            if location is first:
+                self._cycle(node, result)
+                return
+            location = location[0]
+
+        issues = self._issues.get(key)
+        if issues is None:
+            if key in self._active:
+                self._cycle(node, result)
+                return
+            self._active.add(key)
+            own = ValidationResult()
+            self._walk(value, "", own, self)
+            self._active.discard(key)
+            issues = self._issues[key] = (own.errors, own.warnings)
+
+        path = _fmt_path(*node)
+        for found, relative in zip(
+            (result.errors, result.warnings), issues, strict=True
+        ):
+            found.extend(
+                [
+                    ValidationIssue(path + issue.path, issue.message, issue.severity)
+                    for issue in relative
+                ]
+            )
+
+    def _cycle(self, node: Any, result: ValidationResult) -> None:
+        if self._cycle_message is not None:
+            result.add_error(_fmt_path(*node), self._cycle_message)
+
+
+# Exact types that are always valid leaves for a format. Container walks skip
+# pushing them, so most scalars never touch the stack or get a path string.
+# One frozenset lookup beats an inlined "t is int or t is str ..." chain.
+_JSON_LEAVES = frozenset((type(None), bool, int, str))
+_TOML_LEAVES = _JSON_LEAVES | {datetime, date, time}
+_YAML_LEAVES = _JSON_LEAVES | {datetime, date, Decimal}
+# str() cannot fail on these exact types, so XML skips its conversion probe
+_XML_LEAVES = _JSON_LEAVES | {float, bytes, Decimal, datetime, date, time}
+# Types in a list of only floats, see _check_floats
+_FLOAT_ONLY = frozenset((float,))
+
+# Base types to match subclasses (OrderedDict, IntEnum, ...) against, in the
+# order the checks apply. Exact types skip this, see _base_type.
+_JSON_BASES = (bool, int, str, float, dict, list)
+_TOML_BASES = (bool, int, str, datetime, date, time, float, dict, list)
+_YAML_BASES = (bool, int, str, datetime, date, Decimal, float, dict, list)
+_XML_BASES = (dict, list)
+
+# Exact types each walk handles without an isinstance check
+_CONTAINERS = frozenset((dict, list, float, _PendingIssue))
+_JSON_KNOWN = _JSON_LEAVES | _CONTAINERS
+_TOML_KNOWN = _TOML_LEAVES | _CONTAINERS
+_YAML_KNOWN = _YAML_LEAVES | _CONTAINERS
+_XML_KNOWN = _XML_LEAVES | _CONTAINERS
+
+
+# Walk stack entries are (value, parent, sep, name): the value plus where it
+# sits, as the parent's location and the "."/"[" step from it. Path strings
+# like "$.users[0].age" are only built by _fmt_path when an issue is reported,
+# so valid data formats none.
+# The walks stay pure Python: the package ships no compiled extensions, and
+# with leaves skipped in bulk most of the time goes to dict/list iteration that
+# already runs in C.
+_StackEntry = tuple[Any, Any, str, Any]
+
+
+def _fmt_path(parent: Any, sep: str, name: Any) -> str:
+    """Build the path string for a location on the walk stack.
+
+    Args:
+        parent: Location of the parent as (parent, sep, name), or None
+        sep: "." for a dict key, "[" for a list index; for the root, its path
+        name: Key or index in the parent (empty for the root)
+
+    Returns:
+        Path such as "$.users[0].age"
+    """
+    parts = []
+    location = (parent, sep, name)
+    while location is not None:
+        parent, sep, name = location
+        parts.append(f"[{name}]" if sep == "[" else f"{sep}{name}")
+        location = parent
+    return "".join(reversed(parts))
+
+
+def _base_type(value: Any, bases: tuple[type, ...]) -> type:
+    """Return the first of ``bases`` that value is an instance of.
+
+    Only called for values whose exact type is not a known one, so subclasses
+    are validated like their base type. Falls back to type(value).
+    """
+    for base in bases:
+        if isinstance(value, base):
+            return base
+    return type(value)
+
+
+def _enter(
+    value: Any,
+    node: Any,
+    seen: dict[int, Any],
+    shared: _SharedSubtrees,
+    result: ValidationResult,
+) -> bool:
+    """Check whether a walk should push a container's children.
+
+    Called for containers with non-leaf children. The first location a
+    container is reached at is recorded in ``seen`` and walked as usual; at
+    any later location its issues are added by ``shared`` instead.
+
+    Args:
+        value: The container
+        node: Location (parent, sep, name) it is reached at
+        seen: Location each container was first reached at, by id
+        shared: Issues of shared containers
+        result: ValidationResult to accumulate issues
+
+    Returns:
+        True if the children should be walked, False if the container was
+        already handled
+    """
+    first = seen.setdefault(id(value), node)
+    if first is node:
+        return True
+    shared.revisit(value, first, node, result)
+    return False
+
+
+def _check_floats(
+    values: list,
+    parent: Any,
+    sep: str,
+    name: Any,
+    add_error: Callable[[str, str], None],
+) -> bool:
+    """Check a list of exact floats in bulk.
+
+    Float arrays (e.g. telemetry samples) are checked in two C-level passes
+    instead of pushing every element onto the walk stack; only non-finite
+    elements are then visited again, to report them.
+
+    Args:
+        values: Non-empty list whose first element is a float
+        parent: Location of the list's parent
+        sep: "." or "[" step from the parent to the list
+        name: Key or index of the list in its parent
+        add_error: Callback for issues
+
+    Returns:
+        True if the list held only floats and was checked, False if it needs
+        the normal walk
+    """
+    if set(map(type, values)) != _FLOAT_ONLY:
+        return False
+    if not all(map(math.isfinite, values)):
+        node = (parent, sep, name)
+        for i, value in enumerate(values):
+            if not math.isfinite(value):
+                add_error(_fmt_path(node, "[", i), f"non-finite float {value}")
+    return True
+
+
 class JSONValidator:
     """Validator for JSON format.
 
@@ -130,38 +367,79 @@ class JSONValidator:
         self._walk(data, path, result)
         return result
 
-    def _walk(self, value: Any, path: str, result: ValidationResult) -> None:
-        """Recursively walk data structure and validate.
+    def _walk(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+        shared: _SharedSubtrees | None = None,
+    ) -> None:
+        """Walk data structure and validate.
+
+        Uses an explicit stack instead of recursion, so nested data costs no
+        call frame per node and cannot hit the recursion limit. Paths are only
+        formatted for reported issues (see _fmt_path). Containers referenced
+        more than once are only walked once (see _SharedSubtrees).
 
         Args:
-            value: Current value to check
-            path: Current path in data
+            value: Value to check
+            path: Path of the value in data
             result: ValidationResult to accumulate issues
+            shared: Issues of shared containers, kept across nested walks
         """
-        if value is None or isinstance(value, (int, str, bool)):
-            return
-
-        elif isinstance(value, float):
-            if not math.isfinite(value):
-                result.add_error(path, f"non-finite float {value}")
-            return
-
-        elif isinstance(value, dict):
-            for key, subvalue in value.items():
-                if not isinstance(key, str):
-                    result.add_error(path, f"non-string key {key}")
-                self._walk(subvalue, f"{path}.{key}", result)
-            return
-
-        elif isinstance(value, list):
-            for i, subvalue in enumerate(value):
-                self._walk(subvalue, f"{path}[{i}]", result)
-            return
-
-        else:
-            result.add_error(
-                path, f"{value} (type {type(value).__name__}) is not a valid JSON value"
-            )
+        if shared is None:
+            shared = _SharedSubtrees(self._walk, "circular reference")
+        seen: dict[int, Any] = {}
+        add_error = result.add_error
+        isfinite = math.isfinite
+        stack: list[_StackEntry] = [(value, None, path, "")]
+        while stack:
+            value, parent, sep, name = stack.pop()
+            t = type(value)
+            if t not in _JSON_KNOWN:
+                t = _base_type(value, _JSON_BASES)
+
+            if t is dict:
+                node = (parent, sep, name)
+                children: list[_StackEntry] = []
+                for key, subvalue in value.items():
+                    if type(key) is not str and not isinstance(key, str):
+                        issue = _PendingIssue(add_error, f"non-string key {key}")
+                        children.append((issue, parent, sep, name))
+                    if type(subvalue) not in _JSON_LEAVES:
+                        children.append((subvalue, node, ".", key))
+                if children and not _enter(value, node, seen, shared, result):
+                    continue
+                stack.extend(reversed(children))
+            elif t is list:
+                if (
+                    value
+                    and type(value[0]) is float
+                    and _check_floats(value, parent, sep, name, add_error)
+                ):
+                    continue
+                node = (parent, sep, name)
+                children = [
+                    (subvalue, node, "[", i)
+                    for i, subvalue in enumerate(value)
+                    if type(subvalue) not in _JSON_LEAVES
+                ]
+                if children and not _enter(value, node, seen, shared, result):
+                    continue
+                stack.extend(reversed(children))
+            elif t is float:
+                if not isfinite(value):
+                    add_error(_fmt_path(parent, sep, name), f"non-finite float {value}")
+            elif t in _JSON_LEAVES:
+                continue
+            elif t is _PendingIssue:
+                value.report(_fmt_path(parent, sep, name), value.message)
+            else:
+                add_error(
+                    _fmt_path(parent, sep, name),
+                    f"{value} (type {type(value).__name__}) "
+                    f"is not a valid JSON value",
+                )
 
 
 class TOMLValidator:
@@ -188,46 +466,89 @@ class TOMLValidator:
         self._walk(data, path, result)
         return result
 
-    def _walk(self, value: Any, path: str, result: ValidationResult) -> None:
-        """Recursively walk data structure and validate.
+    def _walk(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+        shared: _SharedSubtrees | None = None,
+    ) -> None:
+        """Walk data structure and validate, like JSONValidator._walk.
 
         Args:
-            value: Current value to check
-            path: Current path in data
+            value: Value to check
+            path: Path of the value in data
             result: ValidationResult to accumulate issues
+            shared: Issues of shared containers, kept across nested walks
         """
-        if value is None or isinstance(value, (int, str, bool, datetime, date, time)):
-            return
-
-        elif isinstance(value, float):
-            if not math.isfinite(value):
-                result.add_error(path, f"non-finite float {value}")
-            return
-
-        elif isinstance(value, dict):
-            for key, subvalue in value.items():
-                if not isinstance(key, str):
-                    result.add_error(path, f"non-string key {key}")
-                self._walk(subvalue, f"{path}.{key}", result)
-            return
-
-        elif isinstance(value, list):
-            # TOML requires homogeneous arrays
-            if value:
-                first_type = type(value[0])
-                if not all(isinstance(elem, first_type) for elem in value):
-                    result.add_warning(
-                        path,
-                        "all elements in list must be of the same type (TOML requirement)",
-                    )
-            for i, subvalue in enumerate(value):
-                self._walk(subvalue, f"{path}[{i}]", result)
-            return
-
-        else:
-            result.add_error(
-                path, f"{value} (type {type(value).__name__}) is not a valid TOML value"
-            )
+        if shared is None:
+            shared = _SharedSubtrees(self._walk, "circular reference")
+        seen: dict[int, Any] = {}
+        add_error = result.add_error
+        add_warning = result.add_warning
+        isfinite = math.isfinite
+        stack: list[_StackEntry] = [(value, None, path, "")]
+        while stack:
+            value, parent, sep, name = stack.pop()
+            t = type(value)
+            if t not in _TOML_KNOWN:
+                t = _base_type(value, _TOML_BASES)
+
+            if t is dict:
+                node = (parent, sep, name)
+                children: list[_StackEntry] = []
+                for key, subvalue in value.items():
+                    if type(key) is not str and not isinstance(key, str):
+                        issue = _PendingIssue(add_error, f"non-string key {key}")
+                        children.append((issue, parent, sep, name))
+                    if type(subvalue) not in _TOML_LEAVES:
+                        children.append((subvalue, node, ".", key))
+                if children and not _enter(value, node, seen, shared, result):
+                    continue
+                stack.extend(reversed(children))
+            elif t is list:
+                if (
+                    value
+                    and type(value[0]) is float
+                    and _check_floats(value, parent, sep, name, add_error)
+                ):
+                    continue
+                node = (parent, sep, name)
+                children = [
+                    (subvalue, node, "[", i)
+                    for i, subvalue in enumerate(value)
+                    if type(subvalue) not in _TOML_LEAVES
+                ]
+                if children and not _enter(value, node, seen, shared, result):
+                    continue
+                # TOML requires homogeneous arrays
+                # One C-level set build covers the common case; the
+                # isinstance check only runs for mixed lists (e.g. int and
+                # bool subclass). A short-circuiting any(type(e) is not ...)
+                # only wins on mixed lists; on homogeneous ones it is ~40%
+                # slower.
+                if value and len(set(map(type, value))) > 1:
+                    first_type = type(value[0])
+                    if not all(isinstance(elem, first_type) for elem in value):
+                        add_warning(
+                            _fmt_path(parent, sep, name),
+                            "all elements in list must be of the same type "
+                            "(TOML requirement)",
+                        )
+                stack.extend(reversed(children))
+            elif t is float:
+                if not isfinite(value):
+                    add_error(_fmt_path(parent, sep, name), f"non-finite float {value}")
+            elif t in _TOML_LEAVES:
+                continue
+            elif t is _PendingIssue:
+                value.report(_fmt_path(parent, sep, name), value.message)
+            else:
+                add_error(
+                    _fmt_path(parent, sep, name),
+                    f"{value} (type {type(value).__name__}) "
+                    f"is not a valid TOML value",
+                )
 
 
 class YAMLValidator:
@@ -253,43 +574,78 @@ class YAMLValidator:
         self._walk(data, path, result)
         return result
 
-    def _walk(self, value: Any, path: str, result: ValidationResult) -> None:
-        """Recursively walk data structure and validate.
+    def _walk(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+        shared: _SharedSubtrees | None = None,
+    ) -> None:
+        """Walk data structure and validate, like JSONValidator._walk.
 
         Args:
-            value: Current value to check
-            path: Current path in data
+            value: Value to check
+            path: Path of the value in data
             result: ValidationResult to accumulate issues
+            shared: Issues of shared containers, kept across nested walks
         """
-        if value is None or isinstance(
-            value, (int, str, bool, datetime, date, Decimal)
-        ):
-            return
-
-        elif isinstance(value, float):
-            if not math.isfinite(value):
-                result.add_error(path, f"non-finite float {value}")
-            return
-
-        elif isinstance(value, dict):
-            for key, subvalue in value.items():
-                if not isinstance(key, str):
-                    result.add_warning(
-                        path, f"non-string key {key}. Not recommended for YAML"
-                    )
-                self._walk(subvalue, f"{path}.{key}", result)
-            return
-
-        elif isinstance(value, list):
-            for i, subvalue in enumerate(value):
-                self._walk(subvalue, f"{path}[{i}]", result)
-            return
-
-        else:
-            result.add_error(
-                path,
-                f"{value!r} (type {type(value).__name__}) is not a valid YAML value",
-            )
+        if shared is None:
+            shared = _SharedSubtrees(self._walk, None)
+        seen: dict[int, Any] = {}
+        add_error = result.add_error
+        isfinite = math.isfinite
+        add_warning = result.add_warning
+        stack: list[_StackEntry] = [(value, None, path, "")]
+        while stack:
+            value, parent, sep, name = stack.pop()
+            t = type(value)
+            if t not in _YAML_KNOWN:
+                t = _base_type(value, _YAML_BASES)
+
+            if t is dict:
+                node = (parent, sep, name)
+                children: list[_StackEntry] = []
+                for key, subvalue in value.items():
+                    if type(key) is not str and not isinstance(key, str):
+                        issue = _PendingIssue(
+                            add_warning,
+                            f"non-string key {key}. Not recommended for YAML",
+                        )
+                        children.append((issue, parent, sep, name))
+                    if type(subvalue) not in _YAML_LEAVES:
+                        children.append((subvalue, node, ".", key))
+                if children and not _enter(value, node, seen, shared, result):
+                    continue
+                stack.extend(reversed(children))
+            elif t is list:
+                if (
+                    value
+                    and type(value[0]) is float
+                    and _check_floats(value, parent, sep, name, add_error)
+                ):
+                    continue
+                node = (parent, sep, name)
+                children = [
+                    (subvalue, node, "[", i)
+                    for i, subvalue in enumerate(value)
+                    if type(subvalue) not in _YAML_LEAVES
+                ]
+                if children and not _enter(value, node, seen, shared, result):
+                    continue
+                stack.extend(reversed(children))
+            elif t is float:
+                if not isfinite(value):
+                    add_error(_fmt_path(parent, sep, name), f"non-finite float {value}")
+            elif t in _YAML_LEAVES:
+                continue
+            elif t is _PendingIssue:
+                value.report(_fmt_path(parent, sep, name), value.message)
+            else:
+                add_error(
+                    _fmt_path(parent, sep, name),
+                    f"{value!r} (type {type(value).__name__}) "
+                    f"is not a valid YAML value",
+                )
 
 
 class XMLValidator:
@@ -314,37 +670,114 @@ class XMLValidator:
         self._walk(data, path, result)
         return result
 
-    def _walk(self, value: Any, path: str, result: ValidationResult) -> None:
-        """Recursively walk data structure and validate.
+    def _walk(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+        shared: _SharedSubtrees | None = None,
+    ) -> None:
+        """Walk data structure and validate, like JSONValidator._walk.
 
         Args:
-            value: Current value to check
-            path: Current path in data
+            value: Value to check
+            path: Path of the value in data
             result: ValidationResult to accumulate issues
+            shared: Issues of shared containers, kept across nested walks
         """
-        if isinstance(value, dict):
-            for key, subvalue in value.items():
-                if not isinstance(key, str):
-                    result.add_error(
-                        path, f"non-string key {key!r} (XML tag/attr must be str)"
+        if shared is None:
+            shared = _SharedSubtrees(self._walk, "circular reference")
+        seen: dict[int, Any] = {}
+        add_error = result.add_error
+        stack: list[_StackEntry] = [(value, None, path, "")]
+        while stack:
+            value, parent, sep, name = stack.pop()
+            t = type(value)
+            if t not in _XML_KNOWN:
+                t = _base_type(value, _XML_BASES)
+
+            if t is dict:
+                node = (parent, sep, name)
+                children: list[_StackEntry] = []
+                for key, subvalue in value.items():
+                    if type(key) is not str and not isinstance(key, str):
+                        issue = _PendingIssue(
+                            add_error,
+                            f"non-string key {key!r} (XML tag/attr must be str)",
+                        )
+                        children.append((issue, parent, sep, name))
+                    if type(subvalue) not in _XML_LEAVES:
+                        children.append((subvalue, node, ".", key))
+                if children and not _enter(value, node, seen, shared, result):
+                    continue
+                stack.extend(reversed(children))
+            elif t is list:
+                node = (parent, sep, name)
+                children = [
+                    (subvalue, node, "[", i)
+                    for i, subvalue in enumerate(value)
+                    if type(subvalue) not in _XML_LEAVES
+                ]
+                if children and not _enter(value, node, seen, shared, result):
+                    continue
+                stack.extend(reversed(children))
+            elif t in _XML_LEAVES:
+                continue
+            elif t is _PendingIssue:
+                value.report(_fmt_path(parent, sep, name), value.message)
+            else:
+                # Try to convert to string
+                try:
+                    _ = str(value)
+                except Exception as e:
+                    add_error(
+                        _fmt_path(parent, sep, name),
+                        f"value {value!r} (type {type(value).__name__}) "
+                        f"is not convertible to string for XML: {e}",
                     )
-                self._walk(subvalue, f"{path}.{key}", result)
-            return
-
-        elif isinstance(value, list):
-            for i, subvalue in enumerate(value):
-                self._walk(subvalue, f"{path}[{i}]", result)
-            return
-
-        # Try to convert to string
-        try:
-            _ = str(value)
-        except Exception as e:
-            result.add_error(
-                path,
-                f"value {value!r} (type {type(value).__name__}) "
-                f"is not convertible to string for XML: {e}",
-            )
+
+
+FormatValidator = JSONValidator | TOMLValidator | YAMLValidator | XMLValidator
+
+
+# Validators keep no state between calls, so one instance per format is shared
+_VALIDATORS: dict[FileFormat, FormatValidator] = {
+    FileFormat.JSON: JSONValidator(),
+    FileFormat.TOML: TOMLValidator(),
+    FileFormat.YAML: YAMLValidator(),
+    FileFormat.XML: XMLValidator(),
+}
+
+
+def _get_validator(file_format: FileFormat) -> FormatValidator:
+    """Return the validator for a file format.
+
+    Args:
+        file_format: Target file format
+
+    Returns:
+        Validator instance for the format
+
+    Raises:
+        ValidationError: If format is not supported
+    """
+    validator = _VALIDATORS.get(file_format)
+    if validator is None:
+        raise ValidationError(f"Unsupported file format: {file_format}")
+    return validator
+
+
+def _log_result(result: ValidationResult, file_format: FileFormat) -> None:
+    """Log a summary of validation issues."""
+    if result.errors and logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            f"Validation found {len(result.errors)} error(s) for {file_format.value}"
+        )
+    if result.warnings and logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"Validation found {len(result.warnings)} warning(s) "
+            f"for {file_format.value}"
+        )
 
 
 def validate(data: dict[str, Any], file_format: FileFormat) -> ValidationResult:
@@ -366,34 +799,100 @@ def validate(data: dict[str, Any], file_format: FileFormat) -> ValidationResult:
         >>> result = validate(data, FileFormat.JSON)
         >>> assert result.is_valid()
     """
-    logger.debug(f"Validating data for {file_format.value} format")
-
-    validator: Validator
-    if file_format == FileFormat.JSON:
-        validator = JSONValidator()
-    elif file_format == FileFormat.TOML:
-        validator = TOMLValidator()
-    elif file_format == FileFormat.YAML:
-        validator = YAMLValidator()
-    elif file_format == FileFormat.XML:
-        validator = XMLValidator()
-    else:
-        raise ValidationError(f"Unsupported file format: {file_format}")
+    return validate_into(data, file_format, ValidationResult())
 
-    result = validator.validate(data)
 
-    if result.errors:
-        logger.warning(
-            f"Validation found {len(result.errors)} error(s) for {file_format.value}"
-        )
-    if result.warnings:
-        logger.info(
-            f"Validation found {len(result.warnings)} warning(s) for {file_format.value}"
-        )
+def validate_into(
+    data: Any, file_format: FileFormat, result: ValidationResult
+) -> ValidationResult:
+    """Validate data, adding the issues to an existing result.
+
+    Lets callers that validate many documents reuse one result instead of
+    allocating a new one per call.
+
+    Args:
+        data: Data to validate
+        file_format: Target file format
+        result: ValidationResult to accumulate issues in
+
+    Returns:
+        The given result
+
+    Raises:
+        ValidationError: If format is not supported
+
+    Example:
+        >>> result = ValidationResult()
+        >>> for data in documents:
+        >>>     result.errors.clear()
+        >>>     result.warnings.clear()
+        >>>     validate_into(data, FileFormat.JSON, result)
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Validating data for {file_format.value} format")
+
+    _get_validator(file_format)._walk(data, "$", result)
+    _log_result(result, file_format)
 
     return result
 
 
+class ItemValidator:
+    """Validate list items one at a time, as a filter produces them.
+
+    Passed as the ``on_match`` callback of apply_conditions/process_data so
+    each surviving record is validated while it is being visited, instead of
+    walking the filtered list again afterwards. Issues get the same paths and
+    order that validate() would report for the resulting list.
+
+    Example:
+        >>> check = ItemValidator(FileFormat.JSON)
+        >>> rows = apply_conditions(data, conditions, on_match=check)
+        >>> result = check.finish(rows)
+    """
+
+    def __init__(self, file_format: FileFormat) -> None:
+        """Initialize the validator.
+
+        Args:
+            file_format: Target file format
+
+        Raises:
+            ValidationError: If format is not supported
+        """
+        self._format = file_format
+        self._validator = _get_validator(file_format)
+        self._result = ValidationResult()
+        self._first_type: type | None = None
+        self._mixed_types = False
+
+    def __call__(self, index: int, item: Any) -> None:
+        """Validate the item at position ``index`` of the result list."""
+        if self._first_type is None:
+            self._first_type = type(item)
+        elif not isinstance(item, self._first_type):
+            self._mixed_types = True
+
+        self._validator._walk(item, f"$[{index}]", self._result)
+
+    def finish(self, items: list[Any]) -> ValidationResult:
+        """Return the validation result for the complete list.
+
+        Args:
+            items: The list the validated items were collected into
+
+        Returns:
+            ValidationResult with errors and warnings
+        """
+        if self._mixed_types:
+            # The list itself only produces issues when its items differ in
+            # type (TOML arrays); rare enough to just validate it again
+            return validate_into(items, self._format, ValidationResult())
+
+        _log_result(self._result, self._format)
+        return self._result
+
+
 def format_validation_report(result: ValidationResult) -> str:
     """Format validation result into a human-readable report.
 
@@ -408,6 +907,9 @@ def format_validation_report(result: ValidationResult) -> str:
         >>> result.add_error("$.users[0].age", "Invalid age value")
         >>> print(format_validation_report(result))
     """
+    # Formatting each issue line dominates; extending or preallocating the
+    # list measured no faster than appending. The f-string is compiled once
+    # and beats "%" formatting or concatenation.
     lines: list[str] = []
 
     if result.errors:
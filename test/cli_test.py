@@ -88,6 +88,21 @@ class TestCLICommands:
 
             mock_save.assert_called_once()
 
+    def test_convert_command_with_conditions(self, cli):
+        """Test convert filters and validates the matching records."""
+        cli.current_data = [{"name": "John", "age": 30}, {"name": "Jane", "age": 25}]
+        cli.current_file = Path("input.json")
+
+        with patch("src.cli.smart_save") as mock_save, patch(
+            "src.cli.validate"
+        ) as mock_validate:
+            cli._cmd_convert("to output.yaml where age > 26")
+
+            mock_save.assert_called_once()
+            assert mock_save.call_args[0][0] == [{"name": "John", "age": 30}]
+            # Matches are validated while filtering, not in a second pass
+            mock_validate.assert_not_called()
+
     def test_convert_command_no_data(self, cli):
         """Test convert without loaded data."""
         cli.current_data = None
@@ -150,6 +165,38 @@ class TestCLICommands:
 
             mock_validate.assert_called_once()
 
+    def test_validate_command_reuses_cached_result(self, cli):
+        """Test repeated validation of the same data walks it only once."""
+        cli.current_data = {"name": "John"}
+        cli.current_format = "json"
+
+        with patch("src.cli.validate") as mock_validate:
+            from src.validation import ValidationResult
+
+            mock_validate.return_value = ValidationResult()
+
+            cli._cmd_validate("")
+            cli._cmd_validate("")
+            cli._cmd_validate("yaml")
+
+            assert mock_validate.call_count == 2
+
+    def test_validate_cache_cleared_on_new_data(self, cli):
+        """Test assigning new data invalidates cached validation results."""
+        cli.current_data = {"name": "John"}
+        cli.current_format = "json"
+
+        with patch("src.cli.validate") as mock_validate:
+            from src.validation import ValidationResult
+
+            mock_validate.return_value = ValidationResult()
+
+            cli._cmd_validate("")
+            cli.current_data = {"name": "Jane"}
+            cli._cmd_validate("")
+
+            assert mock_validate.call_count == 2
+
     def test_validate_command_no_data(self, cli):
         """Test validate without loaded data."""
         cli.current_data = None
@@ -239,6 +286,26 @@ class TestCLICommandParsing:
             cli._execute_command("Help")
             assert mock_help.call_count == 2
 
+    def test_data_commands_dispatched(self, cli):
+        """Test data commands are reachable from the command line."""
+        with patch.object(cli, "_cmd_load") as mock_load, patch.object(
+            cli, "_cmd_convert"
+        ) as mock_convert:
+            cli._execute_command("load data.json")
+            cli._execute_command("convert to out.yaml where age > 1")
+
+            mock_load.assert_called_once_with("data.json")
+            mock_convert.assert_called_once_with("to out.yaml where age > 1")
+
+    def test_query_detection(self, cli):
+        """Test input starting with the 'from' keyword is run as a query."""
+        with patch.object(cli, "_execute_query") as mock_query:
+            cli._execute_command("  FROM data.json to out.yaml")
+            mock_query.assert_called_once()
+
+            cli._execute_command("fromage")
+            mock_query.assert_called_once()
+
 
 class TestCLIIntegration:
     """Integration tests for CLI workflow."""
@@ -260,6 +327,20 @@ class TestCLIIntegration:
             cli._cmd_show("")
             # Should display the loaded data
 
+    def test_query_updates_current_format(self, cli):
+        """Test a query leaves the destination loaded with its format."""
+        with patch("src.cli.smart_load") as mock_load, patch(
+            "src.cli.smart_save"
+        ) as mock_save:
+            mock_load.return_value = [{"name": "John"}]
+            cli.current_format = "json"
+
+            cli._execute_query("from input.json to output.yaml")
+
+            mock_save.assert_called_once()
+            assert cli.current_file == Path("output.yaml")
+            assert cli.current_format == "yaml"
+
     def test_load_then_save_workflow(self, cli):
         """Test loading then saving to different format."""
         with patch("src.cli.smart_load") as mock_load, \
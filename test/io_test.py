@@ -9,7 +9,9 @@ Tests cover:
 
 import json
 import tempfile
+from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import toml
@@ -79,12 +81,32 @@ class TestSmartLoad:
         assert isinstance(data, dict)
         assert data is not None
 
+    def test_load_yaml_safe_subset(self):
+        """Test YAML loading parses plain data and rejects Python object tags."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain = Path(tmpdir) / "plain.yaml"
+            plain.write_text("name: Alice\ntags: [a, b]\n", encoding="utf-8")
+            unsafe = Path(tmpdir) / "unsafe.yaml"
+            unsafe.write_text("!!python/object/apply:os.getcwd []\n", encoding="utf-8")
+
+            assert smart_load(plain) == {"name": "Alice", "tags": ["a", "b"]}
+            with pytest.raises(FileLoadError):
+                smart_load(unsafe)
+
     def test_load_file_not_found(self):
         """Test error when file doesn't exist."""
         with pytest.raises(FileLoadError) as exc_info:
             smart_load(Path("nonexistent.json"))
         assert "File not found" in str(exc_info.value)
 
+    def test_load_unsupported_format_checked_first(self):
+        """Test an unsupported extension is rejected without opening the file."""
+        with patch("builtins.open") as mock_open:
+            with pytest.raises(UnsupportedFormatError):
+                smart_load(Path("nonexistent.txt"))
+
+            mock_open.assert_not_called()
+
     def test_load_invalid_json(self):
         """Test error on malformed JSON."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
@@ -97,6 +119,32 @@ class TestSmartLoad:
         finally:
             temp_path.unlink()
 
+    def test_load_xml(self):
+        """Test loading an XML file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "data.xml"
+            path.write_text(
+                '<?xml version="1.0" encoding="utf-8"?>'
+                '<root><user id="1">Алиса</user><user id="2">Bob</user></root>',
+                encoding="utf-8",
+            )
+
+            data = smart_load(path)
+
+            assert data["root"]["user"][0] == {"@id": "1", "#text": "Алиса"}
+            assert data["root"]["user"][1]["#text"] == "Bob"
+
+    def test_load_json_non_standard_numbers(self):
+        """Test NaN literals and big integers load as with the json module."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "numbers.json"
+            path.write_text('{"nan": NaN, "big": 123456789012345678901234567890}')
+
+            data = smart_load(path)
+
+            assert data["big"] == 123456789012345678901234567890
+            assert data["nan"] != data["nan"]
+
 
 class TestSmartSave:
     """Tests for smart file saving."""
@@ -161,6 +209,75 @@ class TestSmartSave:
             smart_save(data, non_atomic_path, atomic=False)
             assert non_atomic_path.exists()
 
+    def test_save_atomic_fsyncs_before_replace(self):
+        """Test atomic saves flush the temp file to disk before renaming it."""
+        calls = []
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("src.io.os.fsync", side_effect=lambda fd: calls.append("fsync")),
+            patch(
+                "src.io.os.replace", side_effect=lambda *args: calls.append("replace")
+            ),
+        ):
+            smart_save({"test": "data"}, Path(tmpdir) / "out.json", atomic=True)
+
+        assert calls == ["fsync", "replace"]
+
+    def test_save_atomic_without_fsync(self):
+        """Test durable=False still renames into place but skips the fsync."""
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("src.io.os.fsync") as mock_fsync,
+        ):
+            output_path = Path(tmpdir) / "out.json"
+            smart_save({"test": "data"}, output_path, atomic=True, durable=False)
+
+            mock_fsync.assert_not_called()
+            assert json.loads(output_path.read_text()) == {"test": "data"}
+            assert list(Path(tmpdir).iterdir()) == [output_path]
+
+    def test_save_serialization_error_keeps_existing_file(self):
+        """Test a failed serialization leaves the destination untouched."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "output.json"
+            output_path.write_text('{"keep": true}')
+
+            for atomic in (True, False):
+                with pytest.raises(FileSaveError):
+                    smart_save({"bad": object()}, output_path, atomic=atomic)
+
+            assert output_path.read_text() == '{"keep": true}'
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["output.json"]
+
+    def test_save_json_big_integer(self):
+        """Test integers beyond 64 bits are saved intact."""
+        data = {"big": 2**70, "nested": {"1": [1, 2]}}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "big.json"
+            smart_save(data, output_path)
+
+            assert json.loads(output_path.read_text()) == data
+
+    def test_save_json_non_finite_floats(self):
+        """Test NaN and Infinity are saved as with the json module."""
+        data = {"nan": float("nan"), "inf": [float("inf"), None]}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "numbers.json"
+            smart_save(data, output_path)
+
+            assert output_path.read_text() == json.dumps(data, indent=2)
+            loaded = smart_load(output_path)
+            assert loaded["nan"] != loaded["nan"]
+            assert loaded["inf"] == [float("inf"), None]
+
+    def test_save_json_datetime_error(self):
+        """Test values the json module can't encode are still rejected."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "dates.json"
+
+            with pytest.raises(FileSaveError):
+                smart_save({"created": date(2024, 1, 1)}, output_path)
+
     def test_save_creates_parent_dirs(self):
         """Test that parent directories are created automatically."""
         data = {"test": "nested"}
@@ -171,6 +288,21 @@ class TestSmartSave:
             assert nested_path.exists()
             assert nested_path.parent.exists()
 
+    def test_save_recreates_removed_dir(self):
+        """Test saving again after the output directory was deleted."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_dir = Path(tmpdir) / "out"
+            for atomic in (True, False):
+                smart_save({"n": 1}, out_dir / "data.json", atomic=atomic)
+                (out_dir / "data.json").unlink()
+                out_dir.rmdir()
+
+                smart_save({"n": 2}, out_dir / "data.json", atomic=atomic)
+
+                assert json.loads((out_dir / "data.json").read_text()) == {"n": 2}
+                (out_dir / "data.json").unlink()
+                out_dir.rmdir()
+
     def test_save_json_with_indent(self):
         """Test JSON saving with custom indent kwarg."""
         data = {"name": "John", "age": 30}
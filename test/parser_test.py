@@ -9,7 +9,15 @@ Tests cover:
 
 import pytest
 
-from src.parser import Condition, ParseError, PathSpec, QueryParser, QueryResult
+from src.grammar import QUERY_GRAMMAR
+from src.parser import (
+    Condition,
+    ParseError,
+    PathSpec,
+    QueryParser,
+    QueryResult,
+    get_parser,
+)
 
 
 class TestQueryParser:
@@ -147,6 +155,57 @@ class TestQueryParser:
         assert result["dest"]["file"] == "filtered.yaml"
         assert len(result["conditions"]) == 3
 
+    def test_parse_repeated_query_returns_independent_results(self, parser):
+        """Test cached parses do not share mutable state between calls."""
+        query = "from data.json to out.yaml where age > 25"
+
+        first = parser.parse(query)
+        first["conditions"][0]["value"] = 99.0
+        second = QueryParser().parse(query)
+
+        assert second == parser.parse(query)
+        assert second["conditions"][0]["value"] == 25.0
+
+    def test_parse_whitespace_and_escapes(self, parser):
+        """Test whitespace between tokens and escaped quotes in strings."""
+        result = parser.parse(
+            'from data.json [ users . * ] to out.yaml where name == "a\\"b"'
+        )
+
+        assert result["source"]["path"] == "users.*"
+        assert result["conditions"][0]["value"] == 'a\\"b'
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "from to to where",
+            "from a.json to b.yaml where and == 1",
+            "from a.json to b.yaml where x == 1 andy == 2",
+            "from a.json to b.yaml where x == trueish",
+            "from a.json to b.yaml where x == 1e",
+            "from a.json to b.yaml where x == .5 and y != -1.e3",
+            "from a.json[users.] to b.yaml",
+            "from a.json[users.*.name] to b.yaml",
+            "from a.json to b.yaml where x = 1",
+            "from a.json to b.yaml extra",
+        ],
+    )
+    def test_accepts_same_queries_as_grammar(self, parser, query):
+        """Test the parser accepts exactly what the Lark grammar accepts."""
+        lark = pytest.importorskip("lark")
+        try:
+            lark.Lark(QUERY_GRAMMAR, parser="lalr").parse(query)
+        except lark.exceptions.LarkError:
+            with pytest.raises(ParseError):
+                parser.parse(query)
+        else:
+            parser.parse(query)
+
+    def test_get_parser_returns_shared_instance(self):
+        """Test get_parser reuses one QueryParser per process."""
+        assert get_parser() is get_parser()
+        assert isinstance(get_parser(), QueryParser)
+
 
 class TestConditionTypedDict:
     """Test Condition TypedDict structure."""
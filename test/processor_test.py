@@ -3,6 +3,7 @@
 Tests cover:
 - JSONPath extraction (apply_path)
 - Condition evaluation (evaluate_condition)
+- Condition compilation (compile_conditions)
 - Data filtering (apply_conditions)
 - Combined processing (process_data)
 """
@@ -11,8 +12,10 @@ import pytest
 
 from src.processor import (
     ProcessorError,
+    _compile_path,
     apply_conditions,
     apply_path,
+    compile_conditions,
     evaluate_condition,
     process_data,
 )
@@ -57,6 +60,30 @@ class TestApplyPath:
 
         assert result == []
 
+    def test_apply_path_wildcard_on_dict(self):
+        """Test a wildcard over a dict yields the dict itself, as in JSONPath."""
+        data = {"config": {"debug": True}}
+
+        assert apply_path(data, "config.*") == {"debug": True}
+        assert apply_path(data, "config.debug.missing") == []
+
+    def test_apply_path_wildcard_segments_only(self):
+        """Test .* is only a wildcard when it is a whole path segment."""
+        data = {"users": [{"name": "John"}, {"name": "Jane"}], "a.*b": 1}
+
+        assert apply_path(data, "users.*.name") == ["John", "Jane"]
+        assert apply_path(data, "'a.*b'") == 1
+
+    def test_apply_path_reuses_compiled_expression(self):
+        """Test repeated complex paths are compiled only once."""
+        _compile_path.cache_clear()
+        data = {"users": [{"name": "John"}, {"name": "Jane"}]}
+
+        for _ in range(3):
+            assert apply_path(data, "users[*].name") == ["John", "Jane"]
+
+        assert _compile_path.cache_info().misses == 1
+
     def test_apply_path_none(self):
         """Test None path returns original data."""
         data = {"test": "data"}
@@ -126,6 +153,13 @@ class TestEvaluateCondition:
         assert evaluate_condition(30.5, ">", 30) is True
         assert evaluate_condition(25, "<", 25.5) is True
 
+    def test_large_integers_compare_exactly(self):
+        """Test ints beyond float precision are not rounded before comparing."""
+        assert evaluate_condition(2**53 + 1, ">", 2**53) is True
+        assert evaluate_condition(2**53 + 1, "==", float(2**53)) is False
+        over = compile_conditions([{"field": "n", "op": ">", "value": 2**53}])
+        assert over({"n": 2**53 + 1}) is True
+
     def test_null_comparison(self):
         """Test None/null handling."""
         assert evaluate_condition(None, "==", None) is True
@@ -142,6 +176,81 @@ class TestEvaluateCondition:
         assert "Unsupported operator" in str(exc_info.value)
 
 
+class TestCompileConditions:
+    """Tests for compiled condition predicates."""
+
+    def test_matches_like_evaluate_condition(self):
+        """Test compiled predicate agrees with evaluate_condition."""
+        conditions = [
+            {"field": "age", "op": ">=", "value": 26.0},
+            {"field": "status", "op": "!=", "value": "deleted"},
+        ]
+        match = compile_conditions(conditions)
+
+        assert match({"age": 30, "status": "active"}) is True
+        assert match({"age": 25, "status": "active"}) is False
+        assert match({"age": 30, "status": "deleted"}) is False
+        assert match({"status": "active"}) is False
+
+    def test_type_mismatch_does_not_match(self):
+        """Test incomparable values are treated as non-matching."""
+        match = compile_conditions([{"field": "age", "op": ">", "value": 25}])
+
+        assert match({"age": "thirty"}) is False
+
+    def test_sampled_type_mismatch_checked_by_type(self):
+        """Test a sample with mismatched types gives the same matches."""
+        rows = [{"age": "30"}, {"age": 30}, {"age": [30]}, {"age": None}, {}]
+        conditions = [{"field": "age", "op": ">", "value": 25}]
+
+        sampled = compile_conditions(conditions, rows)
+        unsampled = compile_conditions(conditions)
+
+        assert sampled.__code__ is not unsampled.__code__
+        assert [sampled(r) for r in rows] == [unsampled(r) for r in rows]
+        assert [sampled(r) for r in rows] == [False, True, False, False, False]
+
+    def test_null_handling(self):
+        """Test None on either side only supports == and !=."""
+        equals_none = compile_conditions([{"field": "x", "op": "==", "value": None}])
+        not_five = compile_conditions([{"field": "x", "op": "!=", "value": 5}])
+        over_none = compile_conditions([{"field": "x", "op": ">", "value": None}])
+
+        assert equals_none({}) is True
+        assert not_five({}) is True
+        assert over_none({"x": 1}) is False
+
+    def test_same_shape_binds_own_values(self):
+        """Test predicates sharing generated code keep their own field/value."""
+        over_25 = compile_conditions([{"field": "age", "op": ">", "value": 25.0}])
+        over_40 = compile_conditions([{"field": "score", "op": ">", "value": 40}])
+
+        assert over_25({"age": 30, "score": 30}) is True
+        assert over_40({"age": 30, "score": 30}) is False
+
+    def test_condition_order_does_not_matter(self):
+        """Test reordered conditions match the same rows and share code."""
+        range_first = [
+            {"field": "age", "op": ">", "value": 25},
+            {"field": "status", "op": "==", "value": "active"},
+        ]
+        rows = [{"age": 30, "status": "active"}, {"age": "x", "status": "active"}, {}]
+
+        first = compile_conditions(range_first)
+        second = compile_conditions(range_first[::-1])
+
+        assert [first(r) for r in rows] == [True, False, False]
+        assert [second(r) for r in rows] == [True, False, False]
+        assert first.__code__ is second.__code__
+
+    def test_unsupported_operator(self):
+        """Test error on unsupported operator at compile time."""
+        with pytest.raises(ProcessorError) as exc_info:
+            compile_conditions([{"field": "age", "op": "~=", "value": 30}])
+
+        assert "Unsupported operator" in str(exc_info.value)
+
+
 class TestApplyConditions:
     """Tests for data filtering with conditions."""
 
@@ -189,6 +298,28 @@ class TestApplyConditions:
 
         assert result == []
 
+    def test_non_dict_items_skipped(self):
+        """Test rows that are not dicts never match."""
+        data = [{"age": 30}, "text", 42, None, [1, 2], {"age": 40}]
+        conditions = [{"field": "age", "op": ">", "value": 25}]
+
+        result = apply_conditions(data, conditions)
+
+        assert result == [{"age": 30}, {"age": 40}]
+
+    def test_on_match_receives_result_positions(self):
+        """Test on_match is called with each match and its index in the result."""
+        data = [{"age": 20}, {"age": 30}, "skip", {"age": 40}]
+        conditions = [{"field": "age", "op": ">", "value": 25}]
+        seen = []
+
+        result = apply_conditions(
+            data, conditions, on_match=lambda i, item: seen.append((i, item))
+        )
+
+        assert seen == [(0, {"age": 30}), (1, {"age": 40})]
+        assert result == [item for _, item in seen]
+
     def test_non_list_input_dict(self):
         """Test handling single dict (wraps in list)."""
         data = {"name": "John", "age": 30}
@@ -232,6 +363,18 @@ class TestProcessData:
         assert len(result) == 1
         assert result[0]["name"] == "John"
 
+    def test_process_results_independent_of_source(self):
+        """Test path results are new lists, not the source list itself."""
+        users = [{"name": "John", "age": 30}, {"name": "Jane", "age": 25}]
+        data = {"users": users}
+        conditions = [{"field": "age", "op": ">", "value": 0}]
+
+        assert apply_path(data, "users.*") is not users
+        result = process_data(data, "users.*", conditions)
+        result.pop()
+
+        assert len(users) == 2
+
     def test_process_no_path_no_conditions(self):
         """Test no processing returns original data."""
         data = {"test": "data"}
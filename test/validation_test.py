@@ -5,16 +5,22 @@ Tests cover:
 - TOML validator
 - YAML validator
 - XML validator
+- Deeply nested data (iterative walk)
+- Shared and circular references
+- Per-item validation during filtering (ItemValidator)
 - Validation results and reporting
 """
 
+import copy
 import math
 from datetime import date, datetime
+from typing import Any
 
 import pytest
 
 from src.io import FileFormat
 from src.validation import (
+    ItemValidator,
     JSONValidator,
     TOMLValidator,
     ValidationError,
@@ -23,6 +29,7 @@ from src.validation import (
     YAMLValidator,
     format_validation_report,
     validate,
+    validate_into,
 )
 
 
@@ -70,6 +77,15 @@ class TestJSONValidator:
         assert not result.is_valid()
         assert "non-finite float" in result.errors[0].message
 
+    def test_float_array_error_paths(self):
+        """Test non-finite values in float arrays are reported by index."""
+        validator = JSONValidator()
+        data = {"samples": [0.5, float("inf"), 1.5, float("nan")]}
+
+        result = validator.validate(data)
+
+        assert [e.path for e in result.errors] == ["$.samples[1]", "$.samples[3]"]
+
     def test_nested_structure(self):
         """Test validation of nested structures."""
         validator = JSONValidator()
@@ -258,6 +274,96 @@ class TestValidateFunctionFactory:
 
         assert isinstance(result, ValidationResult)
 
+    def test_validate_into_existing_result(self):
+        """Test validate_into adds issues to the given result."""
+        result = ValidationResult()
+        result.add_error("$.earlier", "kept")
+
+        returned = validate_into({"v": float("nan")}, FileFormat.JSON, result)
+
+        assert returned is result
+        assert [e.path for e in result.errors] == ["$.earlier", "$.v"]
+
+
+class TestDeepNesting:
+    """Tests for data nested deeper than the recursion limit."""
+
+    def test_deep_nesting_does_not_recurse(self):
+        """Test every validator walks deep data and reports the inner issue."""
+        data: Any = float("nan")
+        for _ in range(5000):
+            data = {"a": [data]}
+
+        for file_format in FileFormat:
+            result = validate(data, file_format)
+            if file_format == FileFormat.XML:
+                assert result.is_valid()
+            else:
+                assert result.errors[0].path.startswith("$.a[0].a[0]")
+                assert "non-finite float" in result.errors[0].message
+
+
+class TestSharedData:
+    """Tests for containers referenced from more than one place."""
+
+    def test_shared_container_reported_at_each_path(self):
+        """Test a reused dict gives the same issues as separate copies."""
+        template = {"v": float("nan"), "k": [1, "a"], 1: {"x": None}}
+        shared = {"a": [template, template], "b": {"c": template}}
+        copies = {
+            "a": [copy.deepcopy(template), copy.deepcopy(template)],
+            "b": {"c": copy.deepcopy(template)},
+        }
+
+        for file_format in FileFormat:
+            result = validate(shared, file_format)
+            expected = validate(copies, file_format)
+            assert result.errors == expected.errors
+            assert result.warnings == expected.warnings
+
+    def test_circular_reference(self):
+        """Test cycles are reported instead of walked forever."""
+        data: dict[str, Any] = {"a": [1]}
+        data["a"].append(data)
+
+        for file_format in (FileFormat.JSON, FileFormat.TOML, FileFormat.XML):
+            result = validate(data, file_format)
+            assert [(e.path, e.message) for e in result.errors] == [
+                ("$.a[1]", "circular reference")
+            ]
+
+        # YAML can represent cycles with anchors
+        assert validate(data, FileFormat.YAML).is_valid()
+
+
+class TestItemValidator:
+    """Tests for per-item validation during filtering."""
+
+    def test_matches_validate_on_result(self):
+        """Test issues match validating the finished list."""
+        items = [{"a": 1}, {"b": float("nan"), 2: "x"}, {"c": [1, "s"]}]
+
+        for file_format in FileFormat:
+            check = ItemValidator(file_format)
+            for i, item in enumerate(items):
+                check(i, item)
+
+            expected = validate(items, file_format)
+            result = check.finish(items)
+            assert result.errors == expected.errors
+            assert result.warnings == expected.warnings
+
+    def test_mixed_item_types_checked_as_list(self):
+        """Test the list-level TOML homogeneity check still applies."""
+        items = [{"a": 1}, "text"]
+        check = ItemValidator(FileFormat.TOML)
+        for i, item in enumerate(items):
+            check(i, item)
+
+        result = check.finish(items)
+
+        assert any("same type" in w.message for w in result.warnings)
+
 
 class TestFormatValidationReport:
     """Tests for validation report formatting."""